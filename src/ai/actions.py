@@ -942,14 +942,9 @@ def return_to_protection_zone(hinst, entity):
             return
 
         # 4) crear PolylinePath y FollowPath temporal
-        poly = PolylinePath(pts, closed=False)
-        try:
-            # asegurar primer punto igual a la posición actual para continuidad
-            if getattr(poly, "points", None):
-                poly.points[0] = tuple(entity.get_pos())
-        except Exception:
-            # Si no podemos establecer el primer punto en la posición de la entidad, continuar sin generar una excepción.
-            pass
+        # asegurar primer punto igual a la posición actual para continuidad (antes de construir:
+        # la geometría de los segmentos se precalcula en el constructor)
+        poly = PolylinePath([tuple(entity.get_pos()), *pts[1:]], closed=False)
 
         try:
             start_param = poly.get_param(entity.get_pos(), 0.0)
@@ -6,6 +6,9 @@ from utils.resource_path_dir import resource_path_dir
 
 __all__ = ["Animation", "load_animations", "set_animation_state"]
 
+# (ruta del sprite sheet, ancho de frame) -> número de frames; evita releer el PNG en cada load_animations
+_frame_counts: dict[tuple[str, int], int] = {}
+
 class Animation:
     """
     Representa una animación extraída de un sprite sheet horizontal.
@@ -21,10 +24,13 @@ class Animation:
     - frame_count: número de frames a extraer.
     - frame_duration: duración de cada frame en segundos.
     - scale_to: tupla opcional (width, height) para escalar cada frame.
+    - rotation_step: si es > 0, pre-rota cada frame en incrementos de este número
+      de grados (debe dividir a 360) para evitar `pygame.transform.rotate` por frame.
 
     Métodos relevantes
     - update(dt): avanzar la animación en base a dt (segundos).
     - get_frame(): devuelve el Surface actual.
+    - get_rotated_frame(deg): devuelve el Surface actual rotado `deg` grados.
     - reset(): vuelve al primer frame.
     - __len__(): devuelve la cantidad de frames.
 
@@ -34,6 +40,10 @@ class Animation:
         frame = anim.get_frame()
     """
 
+    # (image_path, frame_width, frame_height, frame_count, scale_to, rotation_step) -> (sprite_sheet, frames, rotated)
+    # Los frames son de solo lectura: se comparten entre instancias y solo el estado de reproducción es propio.
+    _frames_cache: dict[tuple, tuple[pygame.Surface, List[pygame.Surface], List[List[pygame.Surface]]]] = {}
+
     def __init__(
         self,
         image_path: str,
@@ -42,28 +52,55 @@ class Animation:
         frame_count: int,
         frame_duration: float,
         scale_to: Optional[Tuple[int, int]] = None,
+        rotation_step: int = 0,
     ) -> None:
-        # Cargar sprite sheet y extraer frames
-        self.sprite_sheet: pygame.Surface = pygame.image.load(image_path).convert_alpha()
         self.frame_width: int = frame_width
         self.frame_height: int = frame_height
         self.frame_count: int = frame_count
         self.frame_duration: float = frame_duration  # segundos por frame
-        self.frames: List[pygame.Surface] = []
+        self.rotation_step: int = rotation_step
+
+        cache_key = (image_path, frame_width, frame_height, frame_count, scale_to, rotation_step)
+        cached = Animation._frames_cache.get(cache_key)
+        if cached is None:
+            cached = Animation._frames_cache[cache_key] = self._build_frames(*cache_key)
+        self.sprite_sheet: pygame.Surface = cached[0]
+        self.frames: List[pygame.Surface] = cached[1]
+        # Tabla de frames pre-rotados: rotated[frame][i] es el frame rotado i * rotation_step grados
+        self.rotated: List[List[pygame.Surface]] = cached[2]
+
+        self.current_frame: int = 0
+        self.time_acc: float = 0.0
+
+    @staticmethod
+    def _build_frames(
+        image_path: str,
+        frame_width: int,
+        frame_height: int,
+        frame_count: int,
+        scale_to: Optional[Tuple[int, int]],
+        rotation_step: int,
+    ) -> tuple[pygame.Surface, List[pygame.Surface], List[List[pygame.Surface]]]:
+        """Carga el sprite sheet y extrae (y opcionalmente pre-rota) sus frames."""
+        sprite_sheet = pygame.image.load(image_path).convert_alpha()
+        frames: List[pygame.Surface] = []
 
         for i in range(frame_count):
             rect = (i * frame_width, 0, frame_width, frame_height)
-            frame = self.sprite_sheet.subsurface(rect).copy()
+            frame = sprite_sheet.subsurface(rect).copy()
             if scale_to:
                 # Asegurar que scale_to es una tupla de dos enteros
                 frame = pygame.transform.scale(frame, (int(scale_to[0]), int(scale_to[1])))
-            self.frames.append(frame)
+            frames.append(frame)
 
-        if not self.frames:
+        if not frames:
             raise RuntimeError(f"No frames extracted from {image_path}")
 
-        self.current_frame: int = 0
-        self.time_acc: float = 0.0
+        rotated: List[List[pygame.Surface]] = []
+        if rotation_step > 0:
+            angles = range(0, 360, rotation_step)
+            rotated = [[pygame.transform.rotate(frame, a) for a in angles] for frame in frames]
+        return sprite_sheet, frames, rotated
 
     def update(self, dt: float) -> None:
         """
@@ -83,6 +120,17 @@ class Animation:
         """Devuelve el Surface del frame actual."""
         return self.frames[self.current_frame]
 
+    def get_rotated_frame(self, deg: float) -> pygame.Surface:
+        """
+        Devuelve el Surface del frame actual rotado `deg` grados (sentido antihorario).
+        Si hay tabla pre-rotada, el ángulo se cuantiza al múltiplo de rotation_step más cercano.
+        """
+        step = self.rotation_step
+        if step <= 0:
+            return pygame.transform.rotate(self.frames[self.current_frame], deg)
+        rotations = self.rotated[self.current_frame]
+        return rotations[round(deg / step) % len(rotations)]
+
     def reset(self) -> None:
         """Vuelve al primer frame y resetea el acumulador de tiempo."""
         self.current_frame = 0
@@ -97,7 +145,7 @@ class Animation:
         """Cantidad de frames en la animación."""
         return self.frame_count
 
-def load_animations(dir: str, type: str, states_anims: type[Enum], w_tile: int, h_tile: int, frame_duration: float, scale: float) -> dict[str, Animation]:
+def load_animations(dir: str, type: str, states_anims: type[Enum], w_tile: int, h_tile: int, frame_duration: float, scale: float, rotation_step: int = 0) -> dict[str, Animation]:
     """
     Carga las animaciones para un personaje (enemigo o jugador) dado su tipo y estados.
     Retorna un diccionario con las animaciones cargadas.
@@ -112,20 +160,23 @@ def load_animations(dir: str, type: str, states_anims: type[Enum], w_tile: int,
     - w_tile, h_tile: tamaño de cada frame en el sprite sheet original.
     - frame_duration: duración de cada frame en segundos.
     - scale: factor de escala para redimensionar cada frame.
+    - rotation_step: incremento en grados de los frames pre-rotados (0 = sin pre-rotación).
     """
-    base = os.path.join("assets", dir)
+    # Funciones y carpeta base resueltas una sola vez fuera del bucle
+    _join, _exists, _load = os.path.join, os.path.exists, pygame.image.load
+    base_abs = resource_path_dir("assets", dir)
     anims = {}
     scale_to = (int(w_tile * scale), int(h_tile * scale))
     for state in states_anims:
         state_value = state.value
         filename = f"{type}-{state_value}.png"
-        path = resource_path_dir(os.path.join(base, filename))
-        if os.path.exists(path):
-            img = pygame.image.load(path)
-            frame_count = img.get_width() // w_tile
-            anims[state_value] = Animation(path, w_tile, h_tile, frame_count, frame_duration, scale_to=scale_to)
-        else:
-            raise RuntimeError(f"No se encontró la animación '{state}' para '{type}'. Verifica que exista el archivo '{path}'.")
+        path = _join(base_abs, filename)
+        frame_count = _frame_counts.get((path, w_tile))
+        if frame_count is None:
+            if not _exists(path):
+                raise RuntimeError(f"No se encontró la animación '{state}' para '{type}'. Verifica que exista el archivo '{path}'.")
+            frame_count = _frame_counts[(path, w_tile)] = _load(path).get_width() // w_tile
+        anims[state_value] = Animation(path, w_tile, h_tile, frame_count, frame_duration, scale_to=scale_to, rotation_step=rotation_step)
     return anims
 
 def set_animation_state(character, state: str):
@@ -137,10 +188,11 @@ def set_animation_state(character, state: str):
     - character: objeto que tiene atributos 'state', 'animations' (dict) y 'current_animation'.
     - state: nuevo estado (clave en character.animations).
     """
-    if state != character.state and state in character.animations:
+    anim = character.animations.get(state)
+    if anim is None:
+        raise RuntimeError(f"No se encontró la animación '{state}' para '{character.type}'.")
+    if state != character.state:
         character.state = state
-        character.current_animation = character.animations[state]
-        character.current_animation.current_frame = 0
-        character.current_animation.time_acc = 0
-    if state not in character.animations:
-        raise RuntimeError(f"No se encontró la animación '{state}' para '{character.type}'.")
\ No newline at end of file
+        character.current_animation = anim
+        anim.current_frame = 0
+        anim.time_acc = 0
\ No newline at end of file
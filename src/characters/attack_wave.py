@@ -2,12 +2,16 @@ import pygame
 
 class AttackWave:
     def __init__(self, x, z, color=(50, 120, 255), max_radius=54, duration=25):
+        self.max_radius = max_radius # Radio máximo que alcanzará la onda
+        self.duration = duration     # Duración total de la onda en frames
+        self.reset(x, z, color)
+
+    def reset(self, x, z, color=(50, 120, 255)):
+        # Reinicia el estado de la onda para (re)usarla desde el frame 0
         # Posición inicial de la onda (centro)
         self.x = x
         self.z = z
         self.color = color           # Color de la onda (RGB)
-        self.max_radius = max_radius # Radio máximo que alcanzará la onda
-        self.duration = duration     # Duración total de la onda en frames
         self.frame = 0               # Frame actual (cuenta cuántos frames ha estado activa)
         self.alive = True            # Estado de vida: True si la onda sigue activa, False si debe eliminarse
 
@@ -48,4 +52,23 @@ class AttackWave:
         pygame.draw.circle(circ_surf, (*self.color, alpha), (self.max_radius+1, self.max_radius+1), radius, 2)
         
         # Blittear la onda en la posición correcta de la pantalla
-        surface.blit(circ_surf, (sx - self.max_radius - 1, sz - self.max_radius - 1))
\ No newline at end of file
+        surface.blit(circ_surf, (sx - self.max_radius - 1, sz - self.max_radius - 1))
+
+class AttackWavePool:
+    """
+    Pool de ondas de ataque: reutiliza instancias muertas en lugar de crear nuevas en cada clic.
+    """
+    def __init__(self):
+        self._free: list[AttackWave] = []  # Ondas liberadas listas para reutilizarse
+
+    def get(self, x, z, color=(50, 120, 255)) -> AttackWave:
+        # Reutiliza una onda libre (O(1)) o crea una nueva si el pool está vacío
+        if self._free:
+            wave = self._free.pop()
+            wave.reset(x, z, color)
+            return wave
+        return AttackWave(x, z, color=color)
+
+    def release(self, wave: AttackWave) -> None:
+        # Devuelve una onda muerta al pool
+        self._free.append(wave)
@@ -1,11 +1,42 @@
 import os
 import pygame
 import math
+from math import atan2, cos, sin, sqrt
 from kinematics.kinematic import Kinematic, SteeringOutput
-from characters.attack_wave import AttackWave
+from characters.attack_wave import AttackWave, AttackWavePool
 from characters.animation import Animation, load_animations, set_animation_state
 from configs.package import CONF
 
+# Códigos de tecla de movimiento (WASD), resueltos una sola vez al importar
+_KW, _KS, _KA, _KD = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+
+# Parámetros del control de rotación hacia el mouse
+_MAX_ANGULAR_SPEED = 30.0  # Límite superior de velocidad angular (radianes/seg)
+_ANGULAR_ACCEL = 100.0     # Límite superior de aceleración angular (radianes/seg^2)
+_K_P = 16.0                # Ganancia proporcional (qué tan fuerte responde al error angular)
+_K_D = 6.0                 # Ganancia derivativa (qué tan fuerte responde a la velocidad de giro actual)
+
+def _angular_steering(delta: float, rotation: float) -> float:
+    """
+    Control proporcional-derivativo (PD) de la rotación: devuelve el steering angular
+    para corregir el error angular `delta` dada la velocidad de giro actual `rotation`.
+    Solo opera con escalares (sin atributos ni llamadas a builtins) porque se ejecuta cada frame.
+    """
+    # 1. Velocidad de rotación deseada usando PD, limitada a ±_MAX_ANGULAR_SPEED
+    desired_rot = _K_P * delta - _K_D * rotation
+    if desired_rot > _MAX_ANGULAR_SPEED:
+        desired_rot = _MAX_ANGULAR_SPEED
+    elif desired_rot < -_MAX_ANGULAR_SPEED:
+        desired_rot = -_MAX_ANGULAR_SPEED
+    # 2. El steering angular es la diferencia entre la rotación deseada y la actual,
+    #    limitado a ±_ANGULAR_ACCEL para evitar cambios bruscos
+    angular = desired_rot - rotation
+    if angular > _ANGULAR_ACCEL:
+        return _ANGULAR_ACCEL
+    if angular < -_ANGULAR_ACCEL:
+        return -_ANGULAR_ACCEL
+    return angular
+
 class Player(Kinematic):
     """
     Clase que representa al jugador controlado por el usuario.
@@ -29,6 +60,7 @@ class Player(Kinematic):
         self.max_speed = max_speed      # Velocidad máxima en píxeles/seg
         self.color = (200, 200, 255)  # Color para las ondas de ataque
         self.attack_waves : list[AttackWave] = []  # Lista de ondas de ataque activas
+        self._wave_pool = AttackWavePool()         # Ondas muertas reutilizables
         self._pending_steering = SteeringOutput()  # Entrada de control pendiente
 
         self.state = CONF.PLAYER.ACTIONS.IDLE
@@ -39,10 +71,13 @@ class Player(Kinematic):
             CONF.PLAYER.TILE_WIDTH, 
             CONF.PLAYER.TILE_HEIGHT,
             frame_duration=0.12,
-            scale=1.25
+            scale=1.25,
+            rotation_step=5
         )
         self.current_animation : Animation = self.animations[self.state]
         self.collider_box = collider_box
+        # Rectángulo de depuración reutilizado entre frames (solo cambia su posición)
+        self._dbg_rect = pygame.Rect(0, 0, int(collider_box[0]), int(collider_box[1]))
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
@@ -51,7 +86,7 @@ class Player(Kinematic):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             set_animation_state(self, CONF.PLAYER.ACTIONS.ATTACK)
             # Crear onda de ataque en la posición actual
-            self.attack_waves.append(AttackWave(self.position[0], self.position[1], color=self.color))
+            self.attack_waves.append(self._wave_pool.get(self.position[0], self.position[1], color=self.color))
 
     def handle_input(self, camera_x: float, camera_y: float, dt: float) -> None:
         """
@@ -61,32 +96,28 @@ class Player(Kinematic):
         # --- Lógica de aceleración y fricción para el movimiento del jugador ---
         # 1. Leer el estado del teclado para detectar las teclas WASD
         keys = pygame.key.get_pressed()
-        accel = [0, 0]       # Vector de aceleración lineal (x, y)
         accel_value = 600    # Magnitud de aceleración máxima (pixeles/seg^2)
         friction = 800       # Magnitud de fricción (pixeles/seg^2) para frenado rápido
         # 2. Determinar la dirección de la aceleración según las teclas presionadas
-        if keys[pygame.K_w]:
-            accel[1] -= 1  # Arriba
-        if keys[pygame.K_s]:
-            accel[1] += 1  # Abajo
-        if keys[pygame.K_a]:
-            accel[0] -= 1  # Izquierda
-        if keys[pygame.K_d]:
-            accel[0] += 1  # Derecha
+        #    (los booleanos valen 0/1: derecha - izquierda, abajo - arriba)
+        accel = [keys[_KD] - keys[_KA], keys[_KS] - keys[_KW]]  # Vector de aceleración lineal (x, y)
         # 3. Si hay input, normalizar el vector y escalarlo a la aceleración máxima
-        mag = math.hypot(accel[0], accel[1])
-        if mag > 0:
-            accel[0] = accel[0] / mag * accel_value
-            accel[1] = accel[1] / mag * accel_value
+        #    (una sola raíz y una división; el resto son multiplicaciones)
+        sq = accel[0] * accel[0] + accel[1] * accel[1]
+        if sq:
+            inv = accel_value / sqrt(sq)
+            accel[0] *= inv
+            accel[1] *= inv
             set_animation_state(self, CONF.PLAYER.ACTIONS.MOVE)
         else:
             # 4. Si no hay input, aplicar fricción para desacelerar suavemente
             vx, vy = self.velocity
-            speed = math.hypot(vx, vy)
-            if speed > 0:
+            sq = vx * vx + vy * vy
+            if sq > 0:
                 # Calcular fricción en dirección opuesta a la velocidad
-                fx = -vx / speed * friction
-                fy = -vy / speed * friction
+                inv_friction = friction / sqrt(sq)
+                fx = -vx * inv_friction
+                fy = -vy * inv_friction
                 # Si la fricción aplicada en este frame es suficiente para detener el movimiento, fuerza la velocidad a cero
                 if abs(fx * dt) >= abs(vx) and abs(fy * dt) >= abs(vy):
                     set_animation_state(self, CONF.PLAYER.ACTIONS.IDLE)
@@ -102,31 +133,18 @@ class Player(Kinematic):
         mx, my = pygame.mouse.get_pos()
         sx = self.position[0] - camera_x
         sy = self.position[1] - camera_y
-        # 2. Calcular el ángulo objetivo (target_angle) entre el jugador y el mouse
-        target_angle = math.atan2(my - sy, mx - sx)
-        current_angle = self.orientation
+        dx = mx - sx
+        dy = my - sy
+        # 2. Vector unitario de la orientación actual
+        co = cos(self.orientation)
+        so = sin(self.orientation)
 
-        # 3. Calcular la diferencia angular mínima entre la orientación actual y la deseada
-        #    Esto asegura que el giro siempre sea por el camino más corto (manejo de wrap-around)
-        delta = (target_angle - current_angle + math.pi) % (2 * math.pi) - math.pi
-        
-        # 4. Parámetros de control de rotación
-        max_angular_speed = 30.0  # Límite superior de velocidad angular (radianes/seg)
-        angular_accel = 100.0     # Límite superior de aceleración angular (radianes/seg^2)
-
-        # 5. Control proporcional-derivativo (PD) para suavizar y estabilizar la rotación
-        #    k_p: Ganancia proporcional (qué tan fuerte responde al error angular)
-        #    k_d: Ganancia derivativa (qué tan fuerte responde a la velocidad de giro actual)
-        k_p = 16.0
-        k_d = 6.0
-        # 6. Calcular la velocidad de rotación deseada usando PD y limitarla
-        desired_rot = max(-max_angular_speed, min(max_angular_speed, k_p * delta - k_d * self.rotation))
-        # 7. El steering angular es la diferencia entre la rotación deseada y la actual
-        angular = desired_rot - self.rotation
-
-        # 8. Limitar la aceleración angular para evitar cambios bruscos
-        if abs(angular) > angular_accel:
-            angular = math.copysign(angular_accel, angular)
+        # 3. Calcular la diferencia angular mínima entre la orientación actual y la dirección al mouse
+        #    atan2(cruz, punto) da directamente el ángulo con signo en (-pi, pi], sin módulo ni wrap-around
+        delta = atan2(co * dy - so * dx, co * dx + so * dy)
+
+        # 4. Control PD para suavizar y estabilizar la rotación
+        angular = _angular_steering(delta, self.rotation)
 
         self._pending_steering = SteeringOutput(linear=tuple(accel), angular=angular)
 
@@ -140,8 +158,7 @@ class Player(Kinematic):
         
         # Rotar sprite según orientación (en radianes, sentido antihorario)
         deg = -math.degrees(self.orientation) - 90  # Corrige desfase de 90 grados
-        frame = self.current_animation.get_frame()
-        rotated = pygame.transform.rotate(frame, deg)
+        rotated = self.current_animation.get_rotated_frame(deg)  # Frame pre-rotado (cuantizado a 5°)
         rect = rotated.get_rect(center=(sx, sz))
         surface.blit(rotated, rect)
 
@@ -152,7 +169,8 @@ class Player(Kinematic):
         # Dibujar barra de vida
         self.draw_life_bar(surface, camera_x, camera_z)
 
-        if CONF.DEV.DEBUG:
+        # Con `python -O` (__debug__ es False) el compilador elimina este bloque por completo
+        if __debug__ and CONF.DEV.DEBUG:
             if CONF.DEV.COLLISION_RECTS:
                 self.draw_collision_box(surface, camera_x, camera_z)
 
@@ -162,12 +180,9 @@ class Player(Kinematic):
         """
         sx = self.position[0] - camera_x
         sz = self.position[1] - camera_z
-        player_box = pygame.Rect(
-            int(sx - self.collider_box[0] // 2),
-            int(sz - self.collider_box[1] // 2),
-            int(self.collider_box[0]),
-            int(self.collider_box[1])
-        )
+        player_box = self._dbg_rect
+        player_box.x = int(sx - self.collider_box[0] // 2)
+        player_box.y = int(sz - self.collider_box[1] // 2)
         pygame.draw.rect(surface, (0, 255, 0), player_box, 1)  # Verde, grosor 1
 
     def update(self, collision_rects: list[pygame.Rect], dt: float):
@@ -181,7 +196,17 @@ class Player(Kinematic):
         # Actualizar animación
         self.current_animation.update(dt)
 
-        # Actualizar y limpiar ondas de ataque
-        for wave in self.attack_waves:
+        # Actualizar y limpiar ondas de ataque (caso común: no hay ninguna activa)
+        waves = self.attack_waves
+        if not waves:
+            return
+        # Una sola pasada en reversa: se actualiza cada onda y las muertas se quitan en el sitio
+        # (intercambio con la última, que ya fue actualizada) y vuelven al pool
+        release = self._wave_pool.release
+        for i in range(len(waves) - 1, -1, -1):
+            wave = waves[i]
             wave.update()
-        self.attack_waves = [w for w in self.attack_waves if w.alive]
\ No newline at end of file
+            if not wave.alive:
+                waves[i] = waves[-1]
+                waves.pop()
+                release(wave)
\ No newline at end of file
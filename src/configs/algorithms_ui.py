@@ -1,4 +1,5 @@
 import pygame
+from .algorithms import ALGORITHM
 
 if not pygame.get_init():
     pygame.init()
@@ -18,22 +19,23 @@ TITLE_FONT = pygame.font.SysFont("Segoe UI", 20, bold=True)
 FONT = pygame.font.SysFont("Segoe UI", 16)
 
 BUTTONS = []
-PARSING_BUTTONS = {
-    "ALGORITHM.SEEK_KINEMATIC"        : "SEEK KINEMATIC",
-    "ALGORITHM.FLEE_KINEMATIC"        : "FLEE KINEMATIC",
-    "ALGORITHM.ARRIVE_KINEMATIC"      : "ARRIVE KINEMATIC",
-    "ALGORITHM.WANDER_KINEMATIC"      : "WANDER KINEMATIC",
-    "ALGORITHM.SEEK_DYNAMIC"          : "SEEK DYNAMIC",
-    "ALGORITHM.FLEE_DYNAMIC"          : "FLEE DYNAMIC",
-    "ALGORITHM.ARRIVE_DYNAMIC"        : "ARRIVE DYNAMIC",
-    "ALGORITHM.WANDER_DYNAMIC"        : "WANDER DYNAMIC",
-    "ALGORITHM.ALIGN"                 : "ALIGN",
-    "ALGORITHM.VELOCITY_MATCH"        : "VELOCITY MATCH",
-    "ALGORITHM.PURSUE"                : "PURSUE",
-    "ALGORITHM.EVADE"                 : "EVADE",
-    "ALGORITHM.FACE"                  : "FACE",
-    "ALGORITHM.LOOK_WHERE_YOURE_GOING": "LOOK W. Y. GOING",
-    "ALGORITHM.PATH_FOLLOWING"        : "PATH FOLLOWING",
+# Etiqueta de cada botón indexada por su clave real (miembro de ALGORITHM o texto)
+PARSING_BUTTONS: dict[ALGORITHM | str, str] = {
+    ALGORITHM.SEEK_KINEMATIC          : "SEEK KINEMATIC",
+    ALGORITHM.FLEE_KINEMATIC          : "FLEE KINEMATIC",
+    ALGORITHM.ARRIVE_KINEMATIC        : "ARRIVE KINEMATIC",
+    ALGORITHM.WANDER_KINEMATIC        : "WANDER KINEMATIC",
+    ALGORITHM.SEEK_DYNAMIC            : "SEEK DYNAMIC",
+    ALGORITHM.FLEE_DYNAMIC            : "FLEE DYNAMIC",
+    ALGORITHM.ARRIVE_DYNAMIC          : "ARRIVE DYNAMIC",
+    ALGORITHM.WANDER_DYNAMIC          : "WANDER DYNAMIC",
+    ALGORITHM.ALIGN                   : "ALIGN",
+    ALGORITHM.VELOCITY_MATCH          : "VELOCITY MATCH",
+    ALGORITHM.PURSUE                  : "PURSUE",
+    ALGORITHM.EVADE                   : "EVADE",
+    ALGORITHM.FACE                    : "FACE",
+    ALGORITHM.LOOK_WHERE_YOURE_GOING  : "LOOK W. Y. GOING",
+    ALGORITHM.PATH_FOLLOWING          : "PATH FOLLOWING",
     "ALL"                             : "ALL",
     "NOTHING"                         : "NOTHING"
 }
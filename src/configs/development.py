@@ -1,13 +1,14 @@
 import os
 
+_TRUE_VALUES = frozenset(("true", "yes", "on"))
+
 def extract_value_env(value) -> bool | int:
+    value = value.strip()
     # En caso de valor numerico
-    if value.strip().isdigit():
-        return int(value.strip())
+    if value.isdigit():
+        return int(value)
     # En caso de booleano
-    if value.strip().lower() in ["true", "yes", "on"]:
-        return True
-    return False
+    return value.lower() in _TRUE_VALUES
 
 DEBUG = None
 
@@ -30,9 +31,10 @@ env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
 if os.path.exists(env_path):
     with open(env_path) as f:
         for line in f:
-            if (line.strip() == ""):
+            line = line.strip()
+            if not line:
                 continue
-            field, value = line.strip().split("=", 1)
+            field, _, value = line.partition("=")
             match field:
                 case "DEBUG":
                     DEBUG = extract_value_env(value)
@@ -2,4 +2,7 @@ LEVELS = {
     0 : "level_0.tmx",
     1 : "level_1.tmx",
     2 : "level_2.tmx",
-}
\ No newline at end of file
+}
+
+# Eje de fusión de colisionadores contiguos: "x" (por filas) o "y" (por columnas)
+MERGE_AXIS = "x"
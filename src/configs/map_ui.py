@@ -18,9 +18,10 @@ TITLE_FONT = pygame.font.SysFont("Segoe UI", 20, bold=True)
 FONT = pygame.font.SysFont("Segoe UI", 16)
 
 BUTTONS = []
-PARSING_BUTTONS = {
-    "0" : "Level 0",
-    "1" : "Level 1",
-    "2" : "Level 2",
+# Etiqueta de cada botón indexada por su clave real (número de nivel)
+PARSING_BUTTONS: dict[int, str] = {
+    0 : "Level 0",
+    1 : "Level 1",
+    2 : "Level 2",
 }
 SELECTED = 2
\ No newline at end of file
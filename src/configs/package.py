@@ -1,3 +1,4 @@
+import pygame
 from dataclasses import dataclass, field
 from . import main_window as MAIN_WIN
 from . import development as DEV
@@ -59,6 +60,7 @@ class EnemyConfig:
 @dataclass
 class MapConfig:
     LEVELS: dict = field(default_factory=lambda: dict(MAP.LEVELS))
+    MERGE_AXIS: str = MAP.MERGE_AXIS
 
 @dataclass
 class AlgorithmConfig:
@@ -83,7 +85,8 @@ class AlgorithmUIConfig:
     PARSING_BUTTONS: dict = field(default_factory=lambda: dict(ALG_UI.PARSING_BUTTONS))
     SELECTED = ALG_UI.SELECTED
 
-@dataclass
+# slots: MapSet.draw lee estos atributos en cada frame
+@dataclass(slots=True)
 class MapUIConfig:
     ACTIVE: bool = MAP_UI.ACTIVE
     PANEL_WIDTH: int = MAP_UI.PANEL_WIDTH
@@ -96,11 +99,11 @@ class MapUIConfig:
     TEXT_COLOR: tuple[int, int, int] = MAP_UI.TEXT_COLOR
     TITLE: str = MAP_UI.TITLE
     TITLE_COLOR: tuple[int, int, int] = MAP_UI.TITLE_COLOR
-    TITLE_FONT = MAP_UI.TITLE_FONT
-    FONT = MAP_UI.FONT
+    TITLE_FONT: pygame.font.Font = MAP_UI.TITLE_FONT
+    FONT: pygame.font.Font = MAP_UI.FONT
     BUTTONS: list = field(default_factory=lambda: list(MAP_UI.BUTTONS))
     PARSING_BUTTONS: dict = field(default_factory=lambda: dict(MAP_UI.PARSING_BUTTONS))
-    SELECTED = MAP_UI.SELECTED
+    SELECTED: int = MAP_UI.SELECTED
 
 class Config:
     MAIN_WIN: MainWindowConfig
@@ -7,6 +7,9 @@ from ui.map_set import MapSet
 from helper.entity_manager import EntityManager
 from configs.package import CONF
 
+# Tipos de evento que traen posición del mouse (evita hasattr(event, "pos") en el bucle de eventos)
+_MOUSE_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
 class Game:
     """
     Clase principal que encapsula la lógica y el estado del juego.
@@ -100,6 +103,7 @@ class Game:
         Procesa la cola de eventos de Pygame. Gestiona el cierre del juego
         y delega los eventos a los subsistemas correspondientes (UI, Jugador).
         """
+        mouse_types = _MOUSE_TYPES
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -113,7 +117,7 @@ class Game:
                 ui_handled = self.map_set_ui.handle_event(event)
 
             # 2. Si la UI no manejó el evento, procesamos clicks en el área de juego.
-            if not ui_handled and hasattr(event, "pos"):
+            if not ui_handled and event.type in mouse_types:
                 mx, my = event.pos
 
                 # Si el click fue dentro del área de juego (a la derecha del panel UI)
@@ -140,7 +144,7 @@ class Game:
             return
 
         # Si el evento no tiene posición (ej. teclado), se pasa directamente.
-        if not hasattr(event, "pos"):
+        if event.type not in _MOUSE_TYPES:
             self.entity_manager.player.handle_event(event)
             return
 
@@ -15,6 +15,12 @@ from map.pathfinder import Pathfinder
 from ai.behavior import Behavior
 from configs.package import CONF
 
+# Datos de grupos de enemigos por tipo de grupo ("map" / "alg"), resueltos una sola vez al importar
+_GROUP_DATA: Dict[str, dict] = {
+    "map": map_levels_enemies_data,
+    "alg": list_of_enemies_data,
+}
+
 class EntityManager:
     """
     Descripción
@@ -28,6 +34,7 @@ class EntityManager:
         - kills (int): Contador simple de enemigos eliminados.
         - attack_effects (List[Dict[str, Any]]): Efectos (AOE/VFX) gestionados por el manager.
         - _spawned_entities_meta (List[Dict[str, Any]]): Metadatos para invocados (lifetime, spawn time).
+        - _group_columns (Dict[tuple, tuple]): Columnas (tipos, posiciones, parámetros, behaviors) por grupo ya resuelto.
     
     Métodos y Funciones
         - create_player: Fabrica y registra el jugador.
@@ -50,6 +57,8 @@ class EntityManager:
         self.attack_effects: List[Dict[str, Any]] = []
         # Cada meta: {"entity": Enemy, "lifetime": float, "spawned_at": float}
         self._spawned_entities_meta: List[Dict[str, Any]] = []
+        # (group_type, group_key) -> (types, positions, params, behaviors); los datos de grupos son estáticos
+        self._group_columns: Dict[tuple, tuple] = {}
 
     def create_player(self, **kwargs) -> Player:
         """
@@ -90,28 +99,46 @@ class EntityManager:
             target = self.player
 
         # 2. Instanciar Enemy usando campos provistos
-        enemy = Enemy(
-            type=enemy_data["type"],
-            position=enemy_data["position"],
-            collider_box=enemy_data["collider_box"],
-            target=target,
-            algorithm=enemy_data.get("algorithm"),
-            max_speed=enemy_data.get("max_speed", 120.0),
-            target_radius_dist=enemy_data.get("target_radius_dist", 40.0),
-            slow_radius_dist=enemy_data.get("slow_radius_dist", 150.0),
-            target_radius_deg=enemy_data.get("target_radius_deg", 5 * CONF.CONST.CONVERT_TO_RAD),
-            slow_radius_deg=enemy_data.get("slow_radius_deg", 60 * CONF.CONST.CONVERT_TO_RAD),
-            time_to_target=enemy_data.get("time_to_target", 0.1),
-            max_acceleration=enemy_data.get("max_acceleration", 300.0),
-            max_rotation=enemy_data.get("max_rotation", 2.0),
-            max_angular_accel=enemy_data.get("max_angular_accel", 30.0),
-            max_prediction=enemy_data.get("max_prediction", 0.25),
-            path=enemy_data.get("path"),
-            path_offset=enemy_data.get("path_offset", 1),
+        return self._build_enemy(
+            enemy_data["type"],
+            enemy_data["position"],
+            self._enemy_params(enemy_data),
+            enemy_data.get("behavior"),
+            target,
         )
 
+    @staticmethod
+    def _enemy_params(enemy_data: dict) -> Dict[str, Any]:
+        """
+        Descripción
+            FUNCIÓN: Resuelve los parámetros del constructor de Enemy (salvo tipo y posición),
+            aplicando los valores por defecto de los campos ausentes.
+        """
+        return {
+            "collider_box": enemy_data["collider_box"],
+            "algorithm": enemy_data.get("algorithm"),
+            "max_speed": enemy_data.get("max_speed", 120.0),
+            "target_radius_dist": enemy_data.get("target_radius_dist", 40.0),
+            "slow_radius_dist": enemy_data.get("slow_radius_dist", 150.0),
+            "target_radius_deg": enemy_data.get("target_radius_deg", 5 * CONF.CONST.CONVERT_TO_RAD),
+            "slow_radius_deg": enemy_data.get("slow_radius_deg", 60 * CONF.CONST.CONVERT_TO_RAD),
+            "time_to_target": enemy_data.get("time_to_target", 0.1),
+            "max_acceleration": enemy_data.get("max_acceleration", 300.0),
+            "max_rotation": enemy_data.get("max_rotation", 2.0),
+            "max_angular_accel": enemy_data.get("max_angular_accel", 30.0),
+            "max_prediction": enemy_data.get("max_prediction", 0.25),
+            "path": enemy_data.get("path"),
+            "path_offset": enemy_data.get("path_offset", 1),
+        }
+
+    def _build_enemy(self, type: str, position: tuple, params: Dict[str, Any], behavior_spec: Any, target: Optional[Kinematic]) -> Enemy:
+        """
+        Descripción
+            MÉTODO: Instancia un Enemy con parámetros ya resueltos, le adjunta su behavior y lo registra.
+        """
+        enemy = Enemy(type=type, position=position, target=target, **params)
+
         # 3. Attach behavior if provided (resolve string names)
-        behavior_spec = enemy_data.get("behavior")
         if behavior_spec:
             try:
                 if isinstance(behavior_spec, str):
@@ -325,13 +352,31 @@ class EntityManager:
             - group_type (str): "map" o "alg" para seleccionar dataset.
         """
         self.enemies.clear()
-        enemy_group_data = []
-        if group_type == "map" and group_key in map_levels_enemies_data:
-            enemy_group_data = map_levels_enemies_data[group_key]
-        if group_type == "alg" and group_key in list_of_enemies_data:
-            enemy_group_data = list_of_enemies_data[group_key]
-        for enemy_data in enemy_group_data:
-            self.create_enemy_from_data(enemy_data)
+        types, positions, params, behaviors = self._get_group_columns(group_key, group_type)
+        target = self.player
+        for i in range(len(types)):
+            self._build_enemy(types[i], positions[i], params[i], behaviors[i], target)
+
+    def _get_group_columns(self, group_key: str, group_type: str) -> tuple:
+        """
+        Descripción
+            MÉTODO: Devuelve los datos del grupo en columnas paralelas (tipos, posiciones,
+            parámetros, behaviors). Se resuelven una sola vez por grupo y se reutilizan
+            en cada cambio de escena.
+        """
+        cache_key = (group_type, group_key)
+        columns = self._group_columns.get(cache_key)
+        if columns is None:
+            # Una clave o tipo desconocido produce un grupo vacío
+            enemy_group_data = _GROUP_DATA.get(group_type, {}).get(group_key, ())
+            columns = (
+                tuple(d["type"] for d in enemy_group_data),
+                tuple(d["position"] for d in enemy_group_data),
+                tuple(self._enemy_params(d) for d in enemy_group_data),
+                tuple(d.get("behavior") for d in enemy_group_data),
+            )
+            self._group_columns[cache_key] = columns
+        return columns
 
     def update_enemy_paths_to(self, target_pos: tuple[float, float]) -> None:
         """
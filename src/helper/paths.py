@@ -22,35 +22,43 @@ Notas
 from __future__ import annotations
 import math
 import pygame
+import numpy as np
 from typing import List, Tuple
 
 Vector2 = Tuple[float, float]
 
 
-def _dot(a: Vector2, b: Vector2) -> float:
-    return a[0] * b[0] + a[1] * b[1]
+# Ventanas de hasta este número de segmentos se evalúan con el kernel escalar: para pocos
+# candidatos el coste fijo de cada operación NumPy supera al de un bucle simple
+_SCALAR_WINDOW_MAX = 16
 
 
-def _sub(a: Vector2, b: Vector2) -> Vector2:
-    return (a[0] - b[0], a[1] - b[1])
-
-
-def _add(a: Vector2, b: Vector2) -> Vector2:
-    return (a[0] + b[0], a[1] + b[1])
-
-
-def _mul(a: Vector2, s: float) -> Vector2:
-    return (a[0] * s, a[1] * s)
-
-
-def _lerp(a: Vector2, b: Vector2, t: float) -> Vector2:
-    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
-
-
-def _dist2(a: Vector2, b: Vector2) -> float:
-    dx = a[0] - b[0]
-    dy = a[1] - b[1]
-    return dx * dx + dy * dy
+def _closest_param(seg_ids, ax: List[float], az: List[float], abx: List[float], abz: List[float],
+                   ab_len2: List[float], px: float, pz: float) -> Tuple[float, float]:
+    """
+    Kernel escalar de proyección: recorre los segmentos `seg_ids` y devuelve
+    (best_param, best_d2) del punto más cercano a (px, pz). Misma aritmética que la
+    versión vectorizada (PolylinePath._project), por lo que ambos caminos coinciden bit a bit.
+    """
+    best_d2 = float("inf")
+    best_param = 0.0
+    for i in seg_ids:
+        sx = ax[i]
+        sz = az[i]
+        dx_ = abx[i]
+        dz_ = abz[i]
+        t = ((px - sx) * dx_ + (pz - sz) * dz_) / ab_len2[i]
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        dx = sx + dx_ * t - px
+        dz = sz + dz_ * t - pz
+        d2 = dx * dx + dz * dz
+        if d2 < best_d2:
+            best_d2 = d2
+            best_param = i + t
+    return best_param, best_d2
 
 
 class Path:
@@ -68,20 +76,54 @@ class PolylinePath(Path):
     Path representado por una lista de puntos (vertices).
     Parametrización: param = segment_index + t, t in [0,1].
     Si closed=True el path hace wrap entre último y primer punto.
+    Con allow_global=True (por defecto), get_param repite la búsqueda sobre todos los segmentos
+    cuando el mejor candidato de la ventana queda demasiado lejos (p. ej. una entidad que vuelve
+    a su ruta desde fuera, o un last_param desactualizado). Con False solo se usa la ventana.
     """
 
-    def __init__(self, points: List[Vector2], closed: bool = True, search_window: int = 4) -> None:
+    def __init__(self, points: List[Vector2], closed: bool = True, search_window: int = 4, allow_global: bool = True) -> None:
         if len(points) < 2:
             raise ValueError("PolylinePath requiere al menos 2 puntos.")
-        self.points = points[:]  # copiar
+        self.points: Tuple[Vector2, ...] = tuple(points)  # inmutable: la geometría se precalcula abajo
         self.closed = bool(closed)
         self.segment_count = len(points) if closed else len(points) - 1
         self.search_window = max(1, int(search_window))
-
-    def _segment_point(self, idx: int) -> Tuple[Vector2, Vector2]:
-        a = self.points[idx]
-        b = self.points[(idx + 1) % len(self.points)]
-        return a, b
+        self.allow_global = bool(allow_global)
+
+        # Geometría de los segmentos precalculada como arrays por componente
+        # (segmento i: (ax[i], az[i]) -> (ax[i] + abx[i], az[i] + abz[i]))
+        pts = np.asarray(self.points, dtype=np.float64)
+        ends = np.roll(pts, -1, axis=0) if self.closed else pts[1:]
+        starts = pts[:self.segment_count]
+        ab = ends - starts
+        self._ax = starts[:, 0].copy()
+        self._az = starts[:, 1].copy()
+        self._abx = ab[:, 0].copy()
+        self._abz = ab[:, 1].copy()
+        ab_len2 = self._abx * self._abx + self._abz * self._abz
+        # Segmentos degenerados (longitud 0): dividir por 1 deja t = 0 porque el producto punto también es 0
+        self._ab_len2 = np.where(ab_len2 == 0.0, 1.0, ab_len2)
+        # Desplazamientos de la ventana de búsqueda alrededor del último segmento
+        self._window = np.arange(-self.search_window, self.search_window + 1)
+        # Copia en listas de Python para el kernel escalar (ventanas pequeñas)
+        self._seg_lists = (self._ax.tolist(), self._az.tolist(), self._abx.tolist(), self._abz.tolist(), self._ab_len2.tolist())
+
+    def _project(self, seg_ids, px: float, pz: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Proyecta (px, pz) sobre los segmentos `seg_ids` (índices o slice) de forma vectorizada.
+        Devuelve (t, d2): parámetro local t en [0,1] y distancia al cuadrado al punto proyectado.
+        """
+        ax = self._ax[seg_ids]
+        az = self._az[seg_ids]
+        abx = self._abx[seg_ids]
+        abz = self._abz[seg_ids]
+        t = ((px - ax) * abx + (pz - az) * abz) / self._ab_len2[seg_ids]
+        # clamp a [0, 1] en el sitio (maximum/minimum son más baratos que np.clip en arrays pequeños)
+        np.maximum(t, 0.0, out=t)
+        np.minimum(t, 1.0, out=t)
+        dx = ax + abx * t - px
+        dz = az + abz * t - pz
+        return t, dx * dx + dz * dz
 
     def get_param(self, position: Vector2, last_param: float) -> float:
         """
@@ -93,65 +135,44 @@ class PolylinePath(Path):
         last_seg = int(math.floor(last_param)) if last_param is not None else 0
         last_seg = last_seg % (self.segment_count if self.segment_count > 0 else 1)
 
-        best_dist2 = float("inf")
-        best_param = float(last_seg)
-
-        # window search
-        segs = []
-        for d in range(-self.search_window, self.search_window + 1):
-            seg_idx = (last_seg + d) % self.segment_count if self.closed else (last_seg + d)
-            if seg_idx < 0 or seg_idx >= self.segment_count:
-                continue
-            segs.append(seg_idx)
-
-        # evaluate candidates in window
-        for seg_idx in segs:
-            a, b = self._segment_point(seg_idx)
-            ab = _sub(b, a)
-            ap = _sub((px, pz), a)
-            ab_len2 = _dot(ab, ab)
-            if ab_len2 == 0:
-                t = 0.0
+        # window search: índices de segmento candidatos (en el mismo orden que la ventana)
+        w = self.search_window
+        n = self.segment_count
+        if len(self._window) <= _SCALAR_WINDOW_MAX:
+            # ventana pequeña: kernel escalar sobre listas
+            if self.closed:
+                seg_ids = [(last_seg + d) % n for d in range(-w, w + 1)]
+            else:
+                seg_ids = range(max(0, last_seg - w), min(n, last_seg + w + 1))
+            best_param, best_dist2 = _closest_param(seg_ids, *self._seg_lists, px, pz)
+        else:
+            seg_ids = last_seg + self._window
+            if self.closed:
+                seg_ids %= n
             else:
-                t = _dot(ap, ab) / ab_len2
-                if t < 0.0:
-                    t = 0.0
-                elif t > 1.0:
-                    t = 1.0
-            proj = _add(a, _mul(ab, t))
-            d2 = _dist2(proj, (px, pz))
-            if d2 < best_dist2:
-                best_dist2 = d2
-                best_param = seg_idx + t
-
-        # if window search didn't find a good candidate (should be rare), fallback to global search
-        # Heurística: si best_dist2 is huge, do full search
-        if best_dist2 > 1e6:
-            for seg_idx in range(self.segment_count):
-                a, b = self._segment_point(seg_idx)
-                ab = _sub(b, a)
-                ap = _sub((px, pz), a)
-                ab_len2 = _dot(ab, ab)
-                if ab_len2 == 0:
-                    t = 0.0
-                else:
-                    t = _dot(ap, ab) / ab_len2
-                    t = max(0.0, min(1.0, t))
-                proj = _add(a, _mul(ab, t))
-                d2 = _dist2(proj, (px, pz))
-                if d2 < best_dist2:
-                    best_dist2 = d2
-                    best_param = seg_idx + t
+                seg_ids = seg_ids[(seg_ids >= 0) & (seg_ids < n)]
+
+            # evaluate candidates in window (proyección por lotes sobre todos los segmentos candidatos)
+            t, d2 = self._project(seg_ids, px, pz)
+            best = int(d2.argmin())
+            best_dist2 = float(d2[best])
+            best_param = int(seg_ids[best]) + float(t[best])
+
+        # Búsqueda global si el candidato de la ventana está muy lejos (> 1000 px), salvo que se desactive
+        if self.allow_global and best_dist2 > 1e6:
+            t, d2 = self._project(slice(None), px, pz)
+            best = int(d2.argmin())
+            if d2[best] < best_dist2:
+                best_dist2 = float(d2[best])
+                best_param = best + float(t[best])
 
         # normalize param into range [0, segment_count)
         # If closed, allow wrap; if open clamp to [0, segment_count)
         if self.closed:
-            # param can be larger than segment_count; bring to base cycle
-            base = math.floor(best_param)
-            frac = best_param - base
-            best_param = (base % self.segment_count) + frac
+            # param está en [0, segment_count]; un solo módulo lo lleva al ciclo base
+            best_param %= self.segment_count
         else:
-            best_param = max(0.0, min(float(self.segment_count - 1) + 1.0 - 1e-6, best_param))
+            best_param = max(0.0, min(self.segment_count - 1e-6, best_param))
 
         return float(best_param)
 
@@ -169,8 +190,28 @@ class PolylinePath(Path):
         else:
             seg_idx = max(0, min(self.segment_count - 1, seg_idx))
             t = max(0.0, min(1.0, t))
-        a, b = self._segment_point(seg_idx)
-        return _lerp(a, b, t)
+        # tabla precalculada por segmento: inicio + delta (evita buscar los dos vértices e interpolar)
+        ax, az, abx, abz, _ = self._seg_lists
+        return (ax[seg_idx] + abx[seg_idx] * t, az[seg_idx] + abz[seg_idx] * t)
+
+    def get_positions(self, params: np.ndarray) -> np.ndarray:
+        """
+        Versión por lotes de get_position para llamadores con NumPy.
+        Devuelve un array (..., 2) con la posición de cada param.
+        """
+        params = np.asarray(params, dtype=np.float64)
+        seg = np.floor(params)
+        t = params - seg
+        seg = seg.astype(np.intp)
+        if self.closed:
+            seg %= self.segment_count
+        else:
+            np.clip(seg, 0, self.segment_count - 1, out=seg)
+            np.clip(t, 0.0, 1.0, out=t)
+        out = np.empty(params.shape + (2,), dtype=np.float64)
+        out[..., 0] = self._ax[seg] + self._abx[seg] * t
+        out[..., 1] = self._az[seg] + self._abz[seg] * t
+        return out
 
     def draw(self, surface, camera_x: float = 0.0, camera_z: float = 0.0, color: Tuple[int,int,int] = (255, 255, 0), width: int = 2, draw_nodes: bool = True):
         """
@@ -248,16 +289,18 @@ def make_rectangle_path(width: float, height: float, center: Vector2 = (0.0, 0.0
         (cx - hw, cz + hh),  # top-left
     ]
 
-    points: List[Vector2] = []
+    xs: List[np.ndarray] = []
+    zs: List[np.ndarray] = []
     for side in range(4):
         a = corners[side]
         b = corners[(side + 1) % 4]
         count = max(1, side_counts[side])
-        for k in range(count):
-            t = k / float(count)  # t in [0, 1)
-            pt = _lerp(a, b, t)
-            points.append(pt)
+        t = np.arange(count) / float(count)  # t in [0, 1)
+        # lerp vectorizado de todo el lado
+        xs.append(a[0] + (b[0] - a[0]) * t)
+        zs.append(a[1] + (b[1] - a[1]) * t)
 
+    points: List[Vector2] = list(zip(np.concatenate(xs).tolist(), np.concatenate(zs).tolist()))
     return PolylinePath(points, closed=True)
 
 
@@ -267,10 +310,8 @@ def make_circle_path(radius: float, center: Vector2 = (0.0, 0.0), segments: int
     Esto permite compatibilidad con PolylinePath get_param/search optimizado.
     """
     segs = max(8, int(segments))
-    pts: List[Vector2] = []
-    for i in range(segs):
-        theta = (i / segs) * 2.0 * math.pi
-        x = center[0] + math.cos(theta) * radius
-        z = center[1] + math.sin(theta) * radius
-        pts.append((x, z))
+    theta = (np.arange(segs) / segs) * 2.0 * math.pi
+    xs = center[0] + np.cos(theta) * radius
+    zs = center[1] + np.sin(theta) * radius
+    pts: List[Vector2] = list(zip(xs.tolist(), zs.tolist()))
     return PolylinePath(pts, closed=True)
\ No newline at end of file
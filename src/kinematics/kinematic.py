@@ -108,10 +108,8 @@ class Kinematic:
             collider_box[1]
         )
 
-        for col_rect in collision_rects:
-            if box_collider.colliderect(col_rect):
-                return True  # Colisión detectada
-        return False  # Sin colisiones
+        # collidelist recorre los rectángulos en C y devuelve -1 si no hay colisión
+        return box_collider.collidelist(collision_rects) != -1
 
     def validate_movement(
         self, 
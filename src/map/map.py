@@ -1,5 +1,7 @@
-import os
 import pygame
+from typing import Iterator
+import numpy as np
+from pytmx import TiledMap
 from pytmx.util_pygame import load_pygame
 from utils.resource_path_dir import resource_path_dir
 from .navmesh import NavMesh
@@ -13,21 +15,39 @@ class Map:
         * tmx_data: datos del mapa cargados con pytmx
         * width: ancho del mapa en píxeles (ya escalado)
         * height: alto del mapa en píxeles (ya escalado)
-        * collision_rects: lista de pygame.Rect que representan las áreas de colisión
+        * collision_rects: tupla inmutable de pygame.Rect que representan las áreas de colisión
         * navmesh: instancia de NavMesh para pathfinding
+        * _rect_grid: hash espacial (celda -> índices en collision_rects) para consultas de fase amplia
+        * _layer_arrays: por cada capa visible, matriz np.int32 (alto x ancho) con los GIDs de sus tiles
+        * _scaled_tiles: mapa GID -> imagen del tile ya escalada a RENDER_TILE_SIZE (atlas precalculado)
+        * _debug_collider_surface: superficie semi-transparente de depuración (se crea al primer uso)
     * Métodos:
         * load(level): carga el mapa TMX y procesa colisionadores
         * next_level(): carga el siguiente nivel del mapa
+        * query_rects(aabb): índices de los rectángulos de colisión que solapan un área
         * draw(screen, camera_x, camera_z, camera_width, camera_height): dibuja el mapa en la pantalla
         * draw_collision_rects(screen, camera_x, camera_z, camera_width, camera_height): dibuja los rectángulos de colisión para depuración
+    * Cachés de clase (compartidas entre instancias durante la sesión):
+        * _tmx_cache: nivel -> datos TMX ya parseados
+        * _scaled_atlas_cache: nivel -> atlas de tiles escalados (solo si ya existe la ventana)
+        * _collider_cache: ruta TMX -> mapa GID -> objetos de colisión del tileset
     """
+    _tmx_cache: dict[int, TiledMap] = {}
+    _scaled_atlas_cache: dict[int, dict[int, pygame.Surface]] = {}
+    _collider_cache: dict[str, dict[int, list]] = {}
+
     def __init__(self, level: int) -> None:
         self.level = level
         self.tmx_data = None
         self.width = 0
         self.height = 0
-        self.collision_rects = []
+        self.collision_rects: tuple[pygame.Rect, ...] = ()
+        self._rect_grid: dict[tuple[int, int], list[int]] = {}
         self.navmesh: NavMesh | None = None
+        self._layer_arrays: list[np.ndarray] = []
+        self._scaled_tiles: dict[int, pygame.Surface] = {}
+        self._blit_list: list[tuple[pygame.Surface, tuple[float, float]]] = []  # Se reutiliza entre frames
+        self._debug_collider_surface: pygame.Surface | None = None
         self.load()
 
     def load(self) -> None:
@@ -38,15 +58,43 @@ class Map:
         * [IMPORTANTE] Para la carga de colisionadores, se asume que existe una capa llamada "walls" en el TMX.
         """
         # --- Se crea la ruta al archivo TMX ---
-        tmx_path = resource_path_dir(os.path.join("assets", "maps", CONF.MAP.LEVELS[self.level]))
-        
-        # --- Cargar datos del mapa TMX ---
-        self.tmx_data = load_pygame(tmx_path)
+        tmx_path = resource_path_dir("assets", "maps", CONF.MAP.LEVELS[self.level])
+
+        # --- Cargar datos del mapa TMX (reutiliza el parseo previo del mismo nivel) ---
+        self.tmx_data = Map._tmx_cache.get(self.level)
+        if self.tmx_data is None:
+            self.tmx_data = load_pygame(tmx_path)
+            Map._tmx_cache[self.level] = self.tmx_data
 
         # --- Calcular el tamaño del mapa en píxeles (ya escalado) ---
         self.width = self.tmx_data.width * CONF.MAIN_WIN.RENDER_TILE_SIZE   # Ancho total del mapa en píxeles
         self.height = self.tmx_data.height * CONF.MAIN_WIN.RENDER_TILE_SIZE # Alto total del mapa en píxeles
 
+        # --- Precalcular los GIDs de cada capa visible ---
+        # Cada capa se guarda como una matriz de GIDs para que draw() recorra únicamente la
+        # porción visible por la cámara en lugar de todos los tiles del mapa.
+        self._layer_arrays = []
+        for layer in self.tmx_data.visible_layers:
+            if hasattr(layer, 'tiles'):
+                self._layer_arrays.append(np.asarray(layer.data, dtype=np.int32))
+
+        # --- Escalar una sola vez cada tile usado (atlas de tiles escalados) ---
+        self._scaled_tiles = Map._scaled_atlas_cache.get(self.level)
+        if self._scaled_tiles is None:
+            # convert_alpha() requiere que la ventana exista; sin ella el atlas no se cachea
+            display_ready = pygame.display.get_surface() is not None
+            tile_size = CONF.MAIN_WIN.RENDER_TILE_SIZE
+            self._scaled_tiles = {}
+            for arr in self._layer_arrays:
+                for gid in np.unique(arr).tolist():
+                    if gid and gid not in self._scaled_tiles:
+                        tile_img = self.tmx_data.get_tile_image_by_gid(gid)
+                        if tile_img:
+                            tile_img = pygame.transform.scale(tile_img, (tile_size, tile_size))
+                            self._scaled_tiles[gid] = tile_img.convert_alpha() if display_ready else tile_img
+            if display_ready:
+                Map._scaled_atlas_cache[self.level] = self._scaled_tiles
+
         # --- Procesar colisionadores y NavMesh ---
         self.collision_rects = []
         navmesh_objects = []
@@ -55,33 +103,45 @@ class Map:
             # Cargar colisionadores de la capa "walls"
             if layer.name == "walls":
                 # Obtiene todos los colisionadores definidos en el tileset (como objectgroup en Tiled)
+                # y los indexa por GID para resolver cada tile del mapa con una sola búsqueda.
+                # El índice se memoriza por ruta TMX para no recorrer el tileset en cada carga.
                 self.collision_rects = []
-                colliders_gen = self.tmx_data.get_tile_colliders()
-                colliders_list = list(colliders_gen)
-
-                # Para cada tile del tileset que tiene colisionador (objectgroup)
-                for i, (tile_id_local, obj_group) in enumerate(colliders_list):
-                    if obj_group is not None:
-                        # Para cada objeto de colisión dentro del objectgroup (puede haber varios por tile)
-                        for obj in obj_group:
-                            # Recorre todo el mapa buscando las posiciones donde ese tile está colocado
-                            for y in range(self.tmx_data.height):
-                                for x in range(self.tmx_data.width):
-                                    gid = self.tmx_data.get_tile_gid(x, y, layer_id)
-                                    # Si el GID del tile en el mapa coincide con el tile_id_local del colisionador
-                                    if gid == tile_id_local:
-                                        # Crea un rectángulo de colisión en coordenadas absolutas del mapa
-                                        rect = pygame.Rect(
-                                            int(x * CONF.MAIN_WIN.RENDER_TILE_SIZE + obj.x),
-                                            int(y * CONF.MAIN_WIN.RENDER_TILE_SIZE + obj.y),
-                                            int(obj.width * CONF.MAIN_WIN.ZOOM),
-                                            int(obj.height * CONF.MAIN_WIN.ZOOM)
-                                        )
-                                        self.collision_rects.append(rect)
+                collider_map = Map._collider_cache.get(tmx_path)
+                if collider_map is None:
+                    collider_map = {
+                        tile_gid: list(obj_group)
+                        for tile_gid, obj_group in self.tmx_data.get_tile_colliders()
+                        if obj_group is not None
+                    }
+                    Map._collider_cache[tmx_path] = collider_map
+                tile_size = CONF.MAIN_WIN.RENDER_TILE_SIZE
+                zoom = CONF.MAIN_WIN.ZOOM
+
+                # Recorre el mapa una sola vez; solo los tiles con colisionador generan rectángulos
+                for x, y, gid in layer.iter_data():
+                    objs = collider_map.get(gid)
+                    if objs is None:
+                        continue
+                    # Puede haber varios objetos de colisión por tile
+                    for obj in objs:
+                        # Crea un rectángulo de colisión en coordenadas absolutas del mapa
+                        self.collision_rects.append(pygame.Rect(
+                            int(x * tile_size + obj.x),
+                            int(y * tile_size + obj.y),
+                            int(obj.width * zoom),
+                            int(obj.height * zoom)
+                        ))
+
+                # Fusionar tiles contiguos en franjas para reducir el número de rectángulos
+                self.collision_rects = self._merge_rects(self.collision_rects, CONF.MAP.MERGE_AXIS)
             
             # Recopilar objetos para NavMesh de la capa "graph"
             if layer.name == "graph":
                 navmesh_objects.extend(list(layer))
+
+        # Se congela como tupla: las entidades la recorren cada frame (Rect.collidelist itera en C)
+        self.collision_rects = tuple(self.collision_rects)
+        self._build_rect_grid()
         
         # Construir el NavMesh si se encontraron objetos
         if navmesh_objects:
@@ -97,6 +157,63 @@ class Map:
             print(f"[Map] Tamaño del mapa en píxeles: {self.width}x{self.height} píxeles.")
             print(f"[Map] Número de colisionadores: {len(self.collision_rects)}.")
 
+    @staticmethod
+    def _merge_rects(rects: list[pygame.Rect], axis: str = "x") -> list[pygame.Rect]:
+        """
+        Fusiona rectángulos contiguos de igual alto (axis="x", por filas) o de igual ancho
+        (axis="y", por columnas) en franjas más largas. El área cubierta no cambia.
+        * Atributos:
+            * rects: lista de pygame.Rect a fusionar
+            * axis: "x" o "y", eje a lo largo del cual se fusiona
+        """
+        if axis == "y":
+            ordered = sorted(rects, key=lambda r: (r.x, r.width, r.y))
+        else:
+            ordered = sorted(rects, key=lambda r: (r.y, r.height, r.x))
+
+        merged: list[pygame.Rect] = []
+        for rect in ordered:
+            if merged:
+                prev = merged[-1]
+                if axis == "y":
+                    if rect.x == prev.x and rect.width == prev.width and rect.y == prev.bottom:
+                        prev.height += rect.height
+                        continue
+                elif rect.y == prev.y and rect.height == prev.height and rect.x == prev.right:
+                    prev.width += rect.width
+                    continue
+            merged.append(pygame.Rect(rect))
+        return merged
+
+    def _build_rect_grid(self) -> None:
+        """
+        Construye el hash espacial uniforme de collision_rects (celda de RENDER_TILE_SIZE).
+        Cada índice se inserta en todas las celdas que toca su rectángulo.
+        """
+        cell = CONF.MAIN_WIN.RENDER_TILE_SIZE
+        self._rect_grid = {}
+        for idx, rect in enumerate(self.collision_rects):
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cz in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    self._rect_grid.setdefault((cx, cz), []).append(idx)
+
+    def query_rects(self, aabb: pygame.Rect) -> Iterator[int]:
+        """
+        Devuelve (sin repetir) los índices de collision_rects que solapan `aabb`,
+        consultando solo las celdas del hash espacial que cubre el área.
+        * Atributos:
+            * aabb: rectángulo de consulta en coordenadas del mapa
+        """
+        cell = CONF.MAIN_WIN.RENDER_TILE_SIZE
+        seen = set()
+        for cx in range(aabb.left // cell, (aabb.right - 1) // cell + 1):
+            for cz in range(aabb.top // cell, (aabb.bottom - 1) // cell + 1):
+                for idx in self._rect_grid.get((cx, cz), ()):
+                    if idx not in seen:
+                        seen.add(idx)
+                        if self.collision_rects[idx].colliderect(aabb):
+                            yield idx
+
     def next_level(self) -> None:
         """
         Carga el siguiente nivel del mapa.
@@ -105,6 +222,18 @@ class Map:
             self.level += 1
             self.load()
 
+    def _visible_tile_range(self, camera_x: float, camera_z: float, camera_width: int, camera_height: int) -> tuple[int, int, int, int]:
+        """
+        Calcula el rango [x0, x1) x [z0, z1) de índices de tiles que intersecan la cámara,
+        acotado a las dimensiones del mapa.
+        """
+        tile_size = CONF.MAIN_WIN.RENDER_TILE_SIZE
+        x0 = max(0, int(camera_x // tile_size))
+        x1 = min(self.tmx_data.width, int((camera_x + camera_width) // tile_size) + 1)
+        z0 = max(0, int(camera_z // tile_size))
+        z1 = min(self.tmx_data.height, int((camera_z + camera_height) // tile_size) + 1)
+        return x0, x1, z0, z1
+
     def draw(self, screen: pygame.Surface, camera_x: int, camera_z: int, camera_width: int, camera_height: int):
         """
         Dibuja todas las capas visibles del mapa en la superficie 'screen',
@@ -116,26 +245,30 @@ class Map:
             * camera_width: ancho del área visible de la cámara
             * camera_height: alto del área visible de la cámara
         """
-        # Itera sobre todas las capas visibles del mapa
-        for layer in self.tmx_data.visible_layers:
-            if hasattr(layer, 'tiles'):
-                # Itera sobre todos los tiles de la capa
-                for x, z, tile in layer.tiles():
-                    tile_img = None
-                    # tile puede ser una Surface o un GID
-                    if isinstance(tile, pygame.Surface):
-                        tile_img = pygame.transform.scale(tile, (CONF.MAIN_WIN.RENDER_TILE_SIZE, CONF.MAIN_WIN.RENDER_TILE_SIZE))
-                    else:
-                        tile_img = self.tmx_data.get_tile_image_by_gid(tile)
-                        if tile_img:
-                            tile_img = pygame.transform.scale(tile_img, (CONF.MAIN_WIN.RENDER_TILE_SIZE, CONF.MAIN_WIN.RENDER_TILE_SIZE))
-                    # Si hay imagen de tile, calcular su posición en pantalla
-                    if tile_img:
-                        sx = x * CONF.MAIN_WIN.RENDER_TILE_SIZE - camera_x  # Posición X en pantalla (ajustada por la cámara)
-                        sz = z * CONF.MAIN_WIN.RENDER_TILE_SIZE - camera_z  # Posición Z en pantalla (ajustada por la cámara)
-                        # Solo dibuja el tile si está dentro de la cámara/ventana
-                        if -CONF.MAIN_WIN.RENDER_TILE_SIZE < sx < camera_width and -CONF.MAIN_WIN.RENDER_TILE_SIZE < sz < camera_height:
-                            screen.blit(tile_img, (sx, sz))
+        tile_size = CONF.MAIN_WIN.RENDER_TILE_SIZE
+        get_tile = self._scaled_tiles.get
+
+        # Rango de tiles visibles por la cámara (no requiere comprobar cada tile por separado)
+        x0, x1, z0, z1 = self._visible_tile_range(camera_x, camera_z, camera_width, camera_height)
+        # Posición en pantalla del tile (x0, z0); el resto se obtiene sumando múltiplos de tile_size
+        origin_x = x0 * tile_size - camera_x
+        origin_z = z0 * tile_size - camera_z
+
+        # Itera sobre la porción visible de cada capa acumulando los blits (en orden de capa)
+        blit_list = self._blit_list
+        blit_list.clear()
+        append = blit_list.append
+        for arr in self._layer_arrays:
+            sub = arr[z0:z1, x0:x1]
+            zs, xs = np.nonzero(sub)
+            for z, x, gid in zip(zs.tolist(), xs.tolist(), sub[zs, xs].tolist()):
+                tile_img = get_tile(gid)
+                if tile_img:
+                    # Posición en pantalla (ajustada por la cámara)
+                    append((tile_img, (origin_x + x * tile_size, origin_z + z * tile_size)))
+
+        # Un único blit por lotes para todos los tiles visibles
+        screen.blits(blit_list, doreturn=0)
 
         if CONF.DEV.DEBUG:
             if CONF.DEV.COLLISION_RECTS:
@@ -155,14 +288,21 @@ class Map:
             * camera_width: ancho del área visible de la cámara
             * camera_height: alto del área visible de la cámara
         """
-        collider_surface = pygame.Surface((CONF.MAIN_WIN.RENDER_TILE_SIZE, CONF.MAIN_WIN.RENDER_TILE_SIZE), pygame.SRCALPHA)
-        collider_surface.fill((255, 0, 0, 100))  # Rojo semi-transparente
-        for rect in self.collision_rects:
+        # La superficie de relleno se crea una sola vez (y se rehace solo si cambia el tamaño de tile)
+        tile_size = CONF.MAIN_WIN.RENDER_TILE_SIZE
+        collider_surface = self._debug_collider_surface
+        if collider_surface is None or collider_surface.get_width() != tile_size:
+            collider_surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+            collider_surface.fill((255, 0, 0, 100))  # Rojo semi-transparente
+            self._debug_collider_surface = collider_surface
+        # Solo se recorren los rectángulos de las celdas visibles por la cámara
+        camera_rect = pygame.Rect(int(camera_x), int(camera_z), camera_width, camera_height)
+        for idx in self.query_rects(camera_rect):
+            rect = self.collision_rects[idx]
             sx = rect.x - camera_x
             sz = rect.y - camera_z
-            if -CONF.MAIN_WIN.RENDER_TILE_SIZE < sx < camera_width and -CONF.MAIN_WIN.RENDER_TILE_SIZE < sz < camera_height:
-                # Dibuja el rectángulo del colisionador con el tamaño real
-                debug_rect = pygame.Rect(sx, sz, rect.width, rect.height)
-                pygame.draw.rect(screen, (255, 0, 0, 120), debug_rect, 1)  # Borde rojo
-                # Si quieres ver el área rellena, descomenta la siguiente línea:
-                # screen.blit(pygame.transform.scale(collider_surface, (rect.width, rect.height)), (sx, sz))
\ No newline at end of file
+            # Dibuja el rectángulo del colisionador con el tamaño real
+            debug_rect = pygame.Rect(sx, sz, rect.width, rect.height)
+            pygame.draw.rect(screen, (255, 0, 0, 120), debug_rect, 1)  # Borde rojo
+            # Si quieres ver el área rellena, descomenta la siguiente línea:
+            # screen.blit(pygame.transform.scale(collider_surface, (rect.width, rect.height)), (sx, sz))
\ No newline at end of file
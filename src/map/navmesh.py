@@ -1,10 +1,30 @@
+import math
 import pygame
+import numpy as np
 from typing import List, Tuple, Dict
 from collections import deque
-from matplotlib.path import Path as MplPath
+from configs.package import CONF
+
+# Escala de la rejilla entera a la que se ajustan los vértices (milésimas de píxel)
+_SNAP_SCALE = 1000
+
+def _point_in_polygon(px: float, py: float, polygon: List[Tuple[float, float]]) -> bool:
+    """
+    Prueba de punto en polígono por cruce de rayos (regla par-impar).
+    Lanza un rayo horizontal hacia +x desde (px, py) y cuenta cuántas aristas cruza.
+    """
+    inside = False
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        if (y2 > py) != (y1 > py) and px < (x1 - x2) * (py - y2) / (y1 - y2) + x2:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
 
 class NavMeshNode:
     """Representa un único polígono transitable (nodo) en el grafo de navegación."""
+    __slots__ = ("id", "polygon", "center", "polygon_i", "neighbors", "neighbor_costs")
+
     def __init__(self, id: int, polygon: List[Tuple[float, float]]):
         self.id = id
         self.polygon = polygon
@@ -12,14 +32,16 @@ class NavMeshNode:
             sum(p[0] for p in polygon) / len(polygon),
             sum(p[1] for p in polygon) / len(polygon)
         )
+        # Vértices ajustados a una rejilla entera para comparar bordes sin tolerancias
+        self.polygon_i: List[Tuple[int, int]] = [(round(x * _SNAP_SCALE), round(y * _SNAP_SCALE)) for x, y in polygon]
         self.neighbors: List[NavMeshNode] = []
-        self.figure = MplPath(self.polygon)
+        self.neighbor_costs: List[float] = []  # Distancia entre centros, alineada con `neighbors`
 
     def contains_point(self, point: Tuple[float, float]) -> bool:
         """
         Devuelve True si `point` (x, y) está dentro del polígono de este nodo.
         """
-        return bool(self.figure.contains_point(point))
+        return _point_in_polygon(point[0], point[1], self.polygon)
     
 class NavMesh:
     """
@@ -29,13 +51,62 @@ class NavMesh:
         self.nodes: Dict[int, NavMeshNode] = {}
         self._build_nodes(objects, zoom)
         self._calculate_edges()
+        self._build_bboxes()
+        self._build_cells()
+        self._build_index_arrays()
+
+    def _build_bboxes(self):
+        """
+        Apila las cajas envolventes (minx, miny, maxx, maxy) de todos los nodos en un arreglo NumPy,
+        alineado con `self._node_list`, para prefiltrar candidatos en get_node_at.
+        """
+        self._node_list: List[NavMeshNode] = list(self.nodes.values())
+        bboxes = [
+            (min(p[0] for p in n.polygon), min(p[1] for p in n.polygon),
+             max(p[0] for p in n.polygon), max(p[1] for p in n.polygon))
+            for n in self._node_list
+        ]
+        self._bboxes = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+
+    def _build_index_arrays(self):
+        """
+        Precalcula la representación indexada del grafo para el pathfinding:
+        - node_index: id de nodo -> índice en `self._node_list`
+        - centers_arr: arreglo NumPy (N, 2) con los centros de los nodos
+        - neighbors_idx: por cada índice, lista de índices de sus vecinos
+        - neighbor_costs: por cada índice, coste de cada arista alineado con `neighbors_idx`
+        """
+        self.node_index: Dict[int, int] = {node.id: i for i, node in enumerate(self._node_list)}
+        self.centers_arr = np.array([node.center for node in self._node_list], dtype=np.float64).reshape(-1, 2)
+        self.neighbors_idx: List[List[int]] = [
+            [self.node_index[nb.id] for nb in node.neighbors] for node in self._node_list
+        ]
+        self.neighbor_costs: List[List[float]] = [node.neighbor_costs for node in self._node_list]
+
+    def _build_cells(self):
+        """
+        Construye un hash espacial uniforme celda -> nodos cuya caja envolvente toca la celda.
+        El tamaño de celda es el mayor entre el ancho medio de los nodos y el tamaño de tile.
+        Dentro de cada celda se respeta el orden de `self._node_list`.
+        """
+        widths = self._bboxes[:, 2] - self._bboxes[:, 0]
+        avg_width = float(widths.mean()) if len(widths) else 0.0
+        self._cell_size: float = max(avg_width, float(CONF.MAIN_WIN.RENDER_TILE_SIZE))
+        cs = self._cell_size
+        self._cells: Dict[Tuple[int, int], List[NavMeshNode]] = {}
+        for node, (minx, miny, maxx, maxy) in zip(self._node_list, self._bboxes.tolist()):
+            for cx in range(int(minx // cs), int(maxx // cs) + 1):
+                for cy in range(int(miny // cs), int(maxy // cs) + 1):
+                    self._cells.setdefault((cx, cy), []).append(node)
 
     def get_node_at(self, position: Tuple[float, float]):
         """
         Devuelve el nodo que contiene `position` (x, y) o None si no hay ninguno.
         Útil para ubicar entidades dentro del NavMesh antes de iniciar pathfinding.
         """
-        for node in self.nodes.values():
+        cs = self._cell_size
+        # Solo se prueban los polígonos registrados en la celda que contiene el punto
+        for node in self._cells.get((int(position[0] // cs), int(position[1] // cs)), ()):
             if node.contains_point(position):
                 return node
         return None
@@ -108,75 +179,87 @@ class NavMesh:
         """
         Calcula las conexiones (aristas) entre nodos adyacentes.
         Dos nodos se consideran adyacentes si sus polígonos comparten un borde.
+
+        Cada segmento se indexa por sus extremos en la rejilla entera (`polygon_i`, sin orientación);
+        los nodos que caen en la misma clave comparten ese borde exacto. Solo los segmentos sin
+        pareja se comparan entre sí con la prueba de colinealidad y solapamiento (bordes parciales).
         """
         node_list = list(self.nodes.values())
-        for i in range(len(node_list)):
-            for j in range(i + 1, len(node_list)):
-                node_a = node_list[i]
-                node_b = node_list[j]
-
-                if self._polygons_share_border(node_a.polygon, node_b.polygon):
-                    node_a.neighbors.append(node_b)
-                    node_b.neighbors.append(node_a)
-
-    def _polygons_share_border(self, poly1: list, poly2: list) -> bool:
-        """Determina si dos polígonos comparten un borde colisionando sus segmentos."""
-        for i in range(len(poly1)):
-            p1 = poly1[i]
-            p2 = poly1[(i + 1) % len(poly1)] # Segmento p1-p2
-
-            for j in range(len(poly2)):
-                p3 = poly2[j]
-                p4 = poly2[(j + 1) % len(poly2)] # Segmento p3-p4
-
-                # Si los segmentos son colineales y se solapan, están compartiendo un borde.
+        order = {node.id: i for i, node in enumerate(node_list)}
+        edges: Dict[tuple, List[NavMeshNode]] = {}
+
+        # 1. Indexar todos los segmentos por clave canónica
+        for node in node_list:
+            poly = node.polygon_i
+            for i in range(len(poly)):
+                a = poly[i]
+                b = poly[(i + 1) % len(poly)]
+                if a == b:
+                    continue  # Segmento degenerado (vértice repetido)
+                key = (a, b) if a < b else (b, a)
+                edges.setdefault(key, []).append(node)
+
+        # 2. Nodos que comparten una clave son vecinos
+        pairs = set()
+        unmatched = []
+        for key, owners in edges.items():
+            if len(owners) == 1:
+                unmatched.append((owners[0], key))
+                continue
+            for i in range(len(owners)):
+                for j in range(i + 1, len(owners)):
+                    if owners[i] is not owners[j]:
+                        pairs.add(frozenset((owners[i].id, owners[j].id)))
+
+        # 3. Respaldo: bordes compartidos solo en parte (segmentos sin pareja colineales y solapados)
+        for i in range(len(unmatched)):
+            node_a, (p1, p2) = unmatched[i]
+            for j in range(i + 1, len(unmatched)):
+                node_b, (p3, p4) = unmatched[j]
+                if node_a is node_b:
+                    continue
+                # Descartar rápido si las cajas envolventes de los segmentos no se tocan
+                if (max(p1[0], p2[0]) < min(p3[0], p4[0]) or max(p3[0], p4[0]) < min(p1[0], p2[0]) or
+                        max(p1[1], p2[1]) < min(p3[1], p4[1]) or max(p3[1], p4[1]) < min(p1[1], p2[1])):
+                    continue
                 if self._are_segments_collinear_and_overlapping(p1, p2, p3, p4):
-                    return True
-        return False
+                    pairs.add(frozenset((node_a.id, node_b.id)))
+
+        # 4. Registrar vecinos manteniendo el orden de inserción de los nodos
+        for pair in pairs:
+            id_a, id_b = tuple(pair)
+            self.nodes[id_a].neighbors.append(self.nodes[id_b])
+            self.nodes[id_b].neighbors.append(self.nodes[id_a])
+        for node in node_list:
+            node.neighbors.sort(key=lambda nb: order[nb.id])
+
+        # 5. Coste de cada arista (la geometría es estática durante el nivel)
+        for node in node_list:
+            ax, ay = node.center
+            node.neighbor_costs = [math.hypot(ax - nb.center[0], ay - nb.center[1]) for nb in node.neighbors]
 
     def _are_segments_collinear_and_overlapping(self, p1: tuple, p2: tuple, p3: tuple, p4: tuple) -> bool:
         """
-        Verifica si dos segmentos de línea son colineales y si su solapamiento
-        es mayor que un solo punto (es decir, comparten un borde real).
+        Verifica si dos segmentos de línea (extremos enteros, ver `polygon_i`) son colineales
+        y si su solapamiento es mayor que un solo punto (es decir, comparten un borde real).
+        Al trabajar con enteros las comparaciones son exactas y no requieren tolerancia.
         """
-        # Tolerancia para comparaciones de punto flotante
-        epsilon = 1e-5
-
-        # 1. Comprobar colinealidad
-        # Vector del primer segmento
-        vec1 = (p2[0] - p1[0], p2[1] - p1[1])
-        # Vectores desde el inicio del primer segmento a los puntos del segundo
-        vec2 = (p3[0] - p1[0], p3[1] - p1[1])
-        vec3 = (p4[0] - p1[0], p4[1] - p1[1])
-        
-        # El producto cruzado de los vectores debe ser (casi) cero para ser colineales
-        cross_product1 = vec1[0] * vec2[1] - vec1[1] * vec2[0]
-        cross_product2 = vec1[0] * vec3[1] - vec1[1] * vec3[0]
-
-        if abs(cross_product1) > epsilon or abs(cross_product2) > epsilon:
+        # 1. Comprobar colinealidad: (p2 - p1) x (p3 - p1) == 0 y (p2 - p1) x (p4 - p1) == 0
+        vx = p2[0] - p1[0]
+        vy = p2[1] - p1[1]
+        if vx * (p3[1] - p1[1]) - vy * (p3[0] - p1[0]) != 0:
+            return False # No son colineales
+        if vx * (p4[1] - p1[1]) - vy * (p4[0] - p1[0]) != 0:
             return False # No son colineales
 
         # 2. Comprobar que el solapamiento es más que un punto
-        # Proyectar los segmentos sobre el eje X
-        dot_p1 = p1[0]
-        dot_p2 = p2[0]
-        dot_p3 = p3[0]
-        dot_p4 = p4[0]
-
-        # Si el segmento es principalmente vertical, usar el eje Y para mayor precisión
-        if abs(vec1[0]) < epsilon:
-            dot_p1 = p1[1]
-            dot_p2 = p2[1]
-            dot_p3 = p3[1]
-            dot_p4 = p4[1]
-
-        # Encontrar los puntos de inicio y fin del intervalo de solapamiento
-        overlap_start = max(min(dot_p1, dot_p2), min(dot_p3, dot_p4))
-        overlap_end = min(max(dot_p1, dot_p2), max(dot_p3, dot_p4))
-
-        # La longitud del solapamiento debe ser mayor que nuestra tolerancia.
-        # Si es ~0, solo se tocan en un punto.
-        return (overlap_end - overlap_start) > epsilon
+        # Proyectar sobre el eje X, o sobre el eje Y si el segmento es vertical
+        axis = 0 if vx != 0 else 1
+        overlap_start = max(min(p1[axis], p2[axis]), min(p3[axis], p4[axis]))
+        overlap_end = min(max(p1[axis], p2[axis]), max(p3[axis], p4[axis]))
+
+        # Si el solapamiento es nulo, solo se tocan en un punto.
+        return overlap_end > overlap_start
 
     def draw(self, surface: pygame.Surface, camera_x: float, camera_z: float):
         """Dibuja el NavMesh (polígonos, centros y conexiones)."""
@@ -4,6 +4,83 @@ from typing import List, Tuple, Optional
 
 from map.navmesh import NavMesh, NavMeshNode
 
+def _astar(
+    start: int,
+    goal: int,
+    centers: List[List[float]],
+    neighbors_idx: List[List[int]],
+    neighbor_costs: List[List[float]],
+) -> Optional[List[int]]:
+    """
+    Núcleo de A* sobre la representación indexada del NavMesh.
+
+    Args:
+        start: índice del nodo inicial.
+        goal: índice del nodo objetivo.
+        centers: centro (x, z) de cada nodo.
+        neighbors_idx: índices de los vecinos de cada nodo.
+        neighbor_costs: coste de cada arista, alineado con `neighbors_idx`.
+
+    Returns:
+        Lista de índices [start, ..., goal] o None si no existe camino.
+    """
+    gx, gy = centers[goal]
+
+    # Estructuras A* indexadas por nodo
+    n = len(centers)
+    g_score = [math.inf] * n
+    came_from = [-1] * n      # índice del predecesor
+    closed = bytearray(n)     # nodos ya expandidos
+    g_score[start] = 0.0
+
+    # Push start: heap de (f_score, índice)
+    sx, sy = centers[start]
+    dx = sx - gx
+    dy = sy - gy
+    f = (dx * dx + dy * dy) ** 0.5
+    open_heap = [(f, start)]
+
+    while open_heap:
+        _, current = heapq.heappop(open_heap)
+
+        # Skip stale entries (mismo nodo puede aparecer varias veces en heap)
+        if closed[current]:
+            continue
+
+        # Si alcanzamos el objetivo -> reconstruir camino
+        if current == goal:
+            path: List[int] = []
+            while current != start:
+                path.append(current)
+                current = came_from[current]
+            path.append(start)
+            path.reverse()
+            return path
+
+        closed[current] = 1
+        g_current = g_score[current]
+
+        # Expandir vecinos (coste de arista precalculado en el NavMesh)
+        for nb, cost in zip(neighbors_idx[current], neighbor_costs[current]):
+            if closed[nb]:
+                continue
+
+            # coste tentativa: g(current) + cost(current, nb)
+            tentative_g = g_current + cost
+
+            if tentative_g < g_score[nb]:
+                came_from[nb] = current
+                g_score[nb] = tentative_g
+                nx, ny = centers[nb]
+                dx = nx - gx
+                dy = ny - gy
+                f = tentative_g + (dx * dx + dy * dy) ** 0.5
+                # push en heap; si ya había entrada menos óptima, se ignorará al extraerla
+                heapq.heappush(open_heap, (f, nb))
+
+    # No se encontró camino
+    return None
+
 class Pathfinder:
     """
     Servicio A* sobre NavMesh (nivel 0).
@@ -26,14 +103,13 @@ class Pathfinder:
             navmesh: NavMesh ya procesado (nodos y vecinos calculados).
         """
         self.navmesh = navmesh
-
-    def _dist(self, a: Tuple[float, float], b: Tuple[float, float]) -> float:
-        """Distancia euclidiana entre dos puntos (x, z)."""
-        return math.hypot(a[0] - b[0], a[1] - b[1])
+        # Centros como listas de floats: el acceso por índice es más barato que sobre el arreglo NumPy
+        self._centers: List[List[float]] = navmesh.centers_arr.tolist()
 
     def find_node_path(self, start_node: NavMeshNode, end_node: NavMeshNode) -> Optional[List[NavMeshNode]]:
         """
         Ejecuta A* entre `start_node` y `end_node`.
+        Traduce los nodos a índices, delega en `_astar` y mapea el resultado de vuelta a nodos.
 
         Args:
             start_node: nodo inicial (NavMeshNode).
@@ -49,55 +125,18 @@ class Pathfinder:
         if start_node == end_node:
             return [start_node]
 
-        # Estructuras A*
-        open_heap = []  # heap de (f_score, node.id, node_obj)
-        came_from = {}  # mapa node.id -> predecessor node_obj
-        g_score = {start_node.id: 0.0}
-        f_score = {start_node.id: self._dist(start_node.center, end_node.center)}
-
-        # Push start
-        heapq.heappush(open_heap, (f_score[start_node.id], start_node.id, start_node))
-
-        closed = set()  # nodos ya expandidos
-
-        while open_heap:
-            _, _, current = heapq.heappop(open_heap)
-
-            # Skip stale entries (mismo nodo puede aparecer varias veces en heap)
-            if current.id in closed:
-                continue
-
-            # Si alcanzamos el objetivo -> reconstruir camino
-            if current is end_node:
-                path: List[NavMeshNode] = []
-                node = current
-                while node.id in came_from:
-                    path.append(node)
-                    node = came_from[node.id]
-                path.append(start_node)
-                path.reverse()
-                return path
-
-            closed.add(current.id)
-
-            # Expandir vecinos
-            for nb in current.neighbors:
-                if nb.id in closed:
-                    continue
-
-                # coste tentativa: g(current) + cost(current, nb)
-                tentative_g = g_score.get(current.id, math.inf) + self._dist(current.center, nb.center)
-
-                if tentative_g < g_score.get(nb.id, math.inf):
-                    came_from[nb.id] = current
-                    g_score[nb.id] = tentative_g
-                    f = tentative_g + self._dist(nb.center, end_node.center)
-                    # push en heap; si ya había entrada menos óptima, se ignorará al extraerla
-                    heapq.heappush(open_heap, (f, nb.id, nb))
-                    f_score[nb.id] = f
-
-        # No se encontró camino
-        return None
+        navmesh = self.navmesh
+        path_idx = _astar(
+            navmesh.node_index[start_node.id],
+            navmesh.node_index[end_node.id],
+            self._centers,
+            navmesh.neighbors_idx,
+            navmesh.neighbor_costs,
+        )
+        if path_idx is None:
+            return None
+        node_list = navmesh._node_list
+        return [node_list[i] for i in path_idx]
 
     def find_path(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float]) -> Optional[List[Tuple[float, float]]]:
         """
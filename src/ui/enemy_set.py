@@ -3,6 +3,9 @@ from data.enemies import list_of_enemies_data
 from configs.package import CONF
 from helper.entity_manager import EntityManager
 
+# Claves de los conjuntos de enemigos (datos estáticos): se calculan una sola vez al importar
+_BUTTON_KEYS: tuple = tuple(list_of_enemies_data.keys())
+
 class EnemySet:
     """
     Gestiona la interfaz de usuario para seleccionar y mostrar conjuntos de enemigos.
@@ -19,6 +22,8 @@ class EnemySet:
                             escenas cuando el usuario selecciona un nuevo conjunto.
         """
         self.entity_manager = entity_manager
+        self._panel_surf: pygame.Surface | None = None  # Fondo del panel (se reutiliza entre frames)
+        self._panel_size = (0, 0)
         self._build_buttons()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -31,52 +36,93 @@ class EnemySet:
         """
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
-            for b in CONF.ALG_UI.BUTTONS:
-                if b["rect"].collidepoint((mx, my)):
-                    CONF.ALG_UI.SELECTED = b["key"]
-                    self.entity_manager.create_enemy_group(b["key"], "alg")
-                    return True  # Evento manejado
+            idx = self._hit(mx, my)
+            if idx >= 0:
+                key = self.button_keys[idx]
+                CONF.ALG_UI.SELECTED = key
+                self.entity_manager.create_enemy_group(key, "alg")
+                return True  # Evento manejado
         return False  # Evento no manejado
 
     def draw(self, surface: pygame.Surface):
         """Dibuja el panel completo de la UI en la superficie dada."""
-        ui_width = CONF.ALG_UI.PANEL_WIDTH
+        alg = CONF.ALG_UI
+        padding = alg.PADDING
+        ui_width = alg.PANEL_WIDTH
         ui_height = surface.get_height()
+        blit = surface.blit
 
-        # Panel con fondo semitransparente
-        panel_rect = pygame.Rect(0, 0, ui_width, ui_height)
-        s = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-        s.fill(CONF.ALG_UI.BG_COLOR)
-        surface.blit(s, (panel_rect.x, panel_rect.y))
+        # Panel con fondo semitransparente (solo se recrea si cambia el tamaño)
+        if self._panel_size != (ui_width, ui_height):
+            self._panel_surf = pygame.Surface((ui_width, ui_height), pygame.SRCALPHA)
+            self._panel_surf.fill(alg.BG_COLOR)
+            self._panel_size = (ui_width, ui_height)
+        blit(self._panel_surf, (0, 0))
 
-        # Título
-        title_surf = CONF.ALG_UI.TITLE_FONT.render(CONF.ALG_UI.TITLE, True, CONF.ALG_UI.TITLE_COLOR)
-        surface.blit(title_surf, (CONF.ALG_UI.PADDING, CONF.ALG_UI.PADDING))
+        # Título (pre-renderizado en _build_buttons)
+        blit(self._title_surf, (padding, padding))
 
-        # Botones
-        mx, my = pygame.mouse.get_pos()
-        for b in CONF.ALG_UI.BUTTONS:
-            rect = b["rect"]
-            hovered = rect.collidepoint((mx, my))
+        # Botones (atributos de configuración ligados a locales antes del bucle)
+        selected = alg.SELECTED
+        hover_c = alg.BUTTON_HOVER
+        active_c = alg.BUTTON_ACTIVE
+        base_c = alg.BUTTON_COLOR
+        draw_rect = pygame.draw.rect
+        keys = self.button_keys
+        labels = self.button_labels
+        label_pos = self.button_label_pos
+        hovered_idx = self._hit(*pygame.mouse.get_pos())
+        for i, rect in enumerate(self.button_rects):
+            hovered = i == hovered_idx
             
-            if b["key"] == CONF.ALG_UI.SELECTED:
-                color = CONF.ALG_UI.BUTTON_ACTIVE
+            if keys[i] == selected:
+                color = active_c
             else:
-                color = CONF.ALG_UI.BUTTON_HOVER if hovered else CONF.ALG_UI.BUTTON_COLOR
+                color = hover_c if hovered else base_c
             
-            label = CONF.ALG_UI.PARSING_BUTTONS.get(str(b["key"]), str(b["key"]))
-            pygame.draw.rect(surface, color, rect, border_radius=6)
-            txt = CONF.ALG_UI.FONT.render(label, True, CONF.ALG_UI.TEXT_COLOR)
-            tx = rect.x + 12
-            ty = rect.y + (rect.height - txt.get_height()) // 2
-            surface.blit(txt, (tx, ty))
+            draw_rect(surface, color, rect, border_radius=6)
+            blit(labels[i], label_pos[i])
+
+    def _hit(self, mx: int, my: int) -> int:
+        """
+        Devuelve el índice del botón bajo (mx, my), o -1 si no hay ninguno.
+        Los botones forman una columna regular, así que el índice se calcula en O(1).
+        """
+        if not (self._x0 <= mx < self._x1):
+            return -1
+        dy = my - self._y0
+        i = dy // self._stride
+        if 0 <= i < len(self.button_keys) and dy % self._stride < self._btn_h:
+            return i
+        return -1
 
     def _build_buttons(self):
-        """Construye la lista de rectángulos para los botones de la UI."""
-        button_keys = list(list_of_enemies_data.keys())
+        """
+        Construye la lista de rectángulos para los botones de la UI.
+        Los textos (título y etiquetas) son estáticos, así que se rasterizan una sola vez aquí.
+        Los datos de cada botón se guardan en listas paralelas (mismo índice) para
+        recorrerlas en draw/handle_event sin acceder a un dict por campo.
+        """
         CONF.ALG_UI.BUTTONS.clear()
+        self.button_keys: list = []
+        self.button_rects: list[pygame.Rect] = []
+        self.button_labels: list[pygame.Surface] = []
+        self.button_label_pos: list[tuple[int, int]] = []
+        self._title_surf = CONF.ALG_UI.TITLE_FONT.render(CONF.ALG_UI.TITLE, True, CONF.ALG_UI.TITLE_COLOR)
         y = CONF.ALG_UI.PADDING + 48
-        for k in button_keys:
+        # Geometría de la columna de botones para el cálculo directo del índice en _hit
+        self._x0 = CONF.ALG_UI.PADDING
+        self._x1 = CONF.ALG_UI.PANEL_WIDTH - CONF.ALG_UI.PADDING
+        self._y0 = y
+        self._btn_h = CONF.ALG_UI.BUTTON_HEIGHT
+        self._stride = CONF.ALG_UI.BUTTON_HEIGHT + 8
+        for k in _BUTTON_KEYS:
             rect = pygame.Rect(CONF.ALG_UI.PADDING, y, CONF.ALG_UI.PANEL_WIDTH - CONF.ALG_UI.PADDING*2, CONF.ALG_UI.BUTTON_HEIGHT)
+            label = CONF.ALG_UI.PARSING_BUTTONS.get(k) or str(k)
+            label_surf = CONF.ALG_UI.FONT.render(label, True, CONF.ALG_UI.TEXT_COLOR)
             CONF.ALG_UI.BUTTONS.append({"key": k, "rect": rect})
+            self.button_keys.append(k)
+            self.button_rects.append(rect)
+            self.button_labels.append(label_surf)
+            self.button_label_pos.append((rect.x + 12, rect.y + (rect.height - label_surf.get_height()) // 2))
             y += CONF.ALG_UI.BUTTON_HEIGHT + 8
\ No newline at end of file
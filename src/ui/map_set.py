@@ -19,6 +19,12 @@ class MapSet:
         """
         self.game_instance = game_instance
         self.entity_manager = entity_manager
+        # Superficies de texto ya renderizadas: (id(font), texto, color) -> Surface
+        self._text_cache: dict[tuple[int, str, tuple], pygame.Surface] = {}
+        self._panel_surf: pygame.Surface | None = None  # Panel ya compuesto (fondo, título y botones)
+        self._panel_size = (0, 0)
+        self._panel_state: tuple | None = None  # (índice del botón bajo el mouse, nivel seleccionado) compuesto
+        self._button_colors: list[tuple | None] = []  # Color con el que está pintado cada botón en el panel
         self._build_buttons()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -31,52 +37,101 @@ class MapSet:
         """
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
-            for b in CONF.MAP_UI.BUTTONS:
-                if b["rect"].collidepoint((mx, my)):
-                    CONF.MAP_UI.SELECTED = b["key"]
-                    self.game_instance.load_level(b["key"], b["key"], "map")
-                    return True  # Evento manejado
+            # Prueba de colisión contra todos los botones en una sola llamada (en C)
+            hit = pygame.Rect(mx, my, 1, 1).collidelist(self._rects)
+            if hit != -1:
+                key = self._keys[hit]
+                CONF.MAP_UI.SELECTED = key
+                self.game_instance.load_level(key, key, "map")
+                return True  # Evento manejado
         return False  # Evento no manejado
 
     def draw(self, surface: pygame.Surface):
-        """Dibuja el panel completo de la UI en la superficie dada."""
-        ui_width = CONF.MAP_UI.PANEL_WIDTH
+        """
+        Dibuja el panel completo de la UI en la superficie dada.
+        El panel se compone en una superficie propia que solo se actualiza cuando cambia
+        el botón bajo el mouse o el nivel seleccionado (y solo en los botones afectados);
+        el resto de frames se reduce a un único blit.
+        """
+        map_ui = CONF.MAP_UI
+        ui_width = map_ui.PANEL_WIDTH
         ui_height = surface.get_height()
 
-        # Panel con fondo semitransparente
-        panel_rect = pygame.Rect(0, 0, ui_width, ui_height)
-        s = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-        s.fill(CONF.MAP_UI.BG_COLOR)
-        surface.blit(s, (panel_rect.x, panel_rect.y))
+        # Estado visual del frame: botón bajo el mouse y nivel seleccionado
+        mx, my = pygame.mouse.get_pos()
+        hovered_idx = pygame.Rect(mx, my, 1, 1).collidelist(self._rects)
+        selected = map_ui.SELECTED
+        state = (hovered_idx, selected)
 
-        # Título
-        title_surf = CONF.MAP_UI.TITLE_FONT.render(CONF.MAP_UI.TITLE, True, CONF.MAP_UI.TITLE_COLOR)
-        surface.blit(title_surf, (CONF.MAP_UI.PADDING, CONF.MAP_UI.PADDING))
+        full = self._panel_size != (ui_width, ui_height)
+        if full:
+            # Recomposición completa: fondo semitransparente y título; los botones se pintan abajo
+            self._panel_surf = pygame.Surface((ui_width, ui_height), pygame.SRCALPHA)
+            self._panel_surf.fill(map_ui.BG_COLOR)
+            title_surf = self._get_text(map_ui.TITLE_FONT, map_ui.TITLE, map_ui.TITLE_COLOR)
+            self._panel_surf.blit(title_surf, (map_ui.PADDING, map_ui.PADDING))
+            self._panel_size = (ui_width, ui_height)
+            self._button_colors = [None] * len(self._rects)
 
-        # Botones
-        mx, my = pygame.mouse.get_pos()
-        for b in CONF.MAP_UI.BUTTONS:
-            rect = b["rect"]
-            hovered = rect.collidepoint((mx, my))
-            
-            if b["key"] == CONF.MAP_UI.SELECTED:
-                color = CONF.MAP_UI.BUTTON_ACTIVE
-            else:
-                color = CONF.MAP_UI.BUTTON_HOVER if hovered else CONF.MAP_UI.BUTTON_COLOR
-            
-            label = CONF.MAP_UI.PARSING_BUTTONS.get(str(b["key"]), str(b["key"]))
-            pygame.draw.rect(surface, color, rect, border_radius=6)
-            txt = CONF.MAP_UI.FONT.render(label, True, CONF.MAP_UI.TEXT_COLOR)
-            tx = rect.x + 12
-            ty = rect.y + (rect.height - txt.get_height()) // 2
-            surface.blit(txt, (tx, ty))
+        if full or state != self._panel_state:
+            # Solo se repintan los botones cuyo color cambia con el nuevo estado
+            panel = self._panel_surf
+            bg_color = map_ui.BG_COLOR
+            active, hover, normal = map_ui.BUTTON_ACTIVE, map_ui.BUTTON_HOVER, map_ui.BUTTON_COLOR
+            keys = self._keys
+            painted = self._button_colors
+            draw_rect = pygame.draw.rect
+            for i, b in enumerate(map_ui.BUTTONS):
+                if keys[i] == selected:
+                    color = active
+                else:
+                    color = hover if i == hovered_idx else normal
+                if color != painted[i]:
+                    rect = b["rect"]
+                    panel.fill(bg_color, rect)  # Las esquinas redondeadas dejan ver el fondo
+                    draw_rect(panel, color, rect, border_radius=6)
+                    panel.blit(b["text_surf"], (b["tx"], b["ty"]))
+                    painted[i] = color
+            self._panel_state = state
+
+        surface.blit(self._panel_surf, (0, 0))
+
+    def _get_text(self, font: pygame.font.Font, label: str, color: tuple) -> pygame.Surface:
+        """
+        Devuelve la superficie de `label` renderizada con `font` y `color`.
+        Los textos son constantes, así que cada combinación se rasteriza una sola vez;
+        un cambio de fuente o color produce una clave nueva.
+        """
+        key = (id(font), label, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(label, True, color)
+            self._text_cache[key] = surf
+        return surf
 
     def _build_buttons(self):
-        """Construye la lista de rectángulos para los botones de la UI."""
+        """
+        Construye la lista de rectángulos para los botones de la UI.
+        Además pre-renderiza el título y las etiquetas en la caché de textos.
+        """
         button_keys = list(map_levels_enemies_data.keys())
         CONF.MAP_UI.BUTTONS.clear()
+        self._get_text(CONF.MAP_UI.TITLE_FONT, CONF.MAP_UI.TITLE, CONF.MAP_UI.TITLE_COLOR)
         y = CONF.MAP_UI.PADDING + 48
         for k in button_keys:
             rect = pygame.Rect(CONF.MAP_UI.PADDING, y, CONF.MAP_UI.PANEL_WIDTH - CONF.MAP_UI.PADDING*2, CONF.MAP_UI.BUTTON_HEIGHT)
-            CONF.MAP_UI.BUTTONS.append({"key": k, "rect": rect})
-            y += CONF.MAP_UI.BUTTON_HEIGHT + 8
\ No newline at end of file
+            label = CONF.MAP_UI.PARSING_BUTTONS.get(k) or str(k)
+            text_surf = self._get_text(CONF.MAP_UI.FONT, label, CONF.MAP_UI.TEXT_COLOR)
+            CONF.MAP_UI.BUTTONS.append({
+                "key": k,
+                "rect": rect,
+                "label": label,
+                "text_surf": text_surf,
+                # Posición del texto (constante): margen izquierdo y centrado vertical en el botón
+                "tx": rect.x + 12,
+                "ty": rect.y + (rect.height - text_surf.get_height()) // 2,
+            })
+            y += CONF.MAP_UI.BUTTON_HEIGHT + 8
+        # Rectángulos y claves en listas paralelas para la prueba de colisión con collidelist
+        self._rects = [b["rect"] for b in CONF.MAP_UI.BUTTONS]
+        self._keys = [b["key"] for b in CONF.MAP_UI.BUTTONS]
\ No newline at end of file
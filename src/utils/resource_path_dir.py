@@ -1,29 +1,39 @@
 import os
 import sys
+from functools import lru_cache
 
-def resource_path_dir(relative_path: str) -> str:
+# Carpetas base resueltas una sola vez al importar el módulo:
+# 1) Si estamos "frozen" (PyInstaller onefile/onedir) resolvemos respecto al exe
+# 2) En desarrollo: la raíz de recursos está en src/ (padre de utils/)
+if getattr(sys, "frozen", False):
+    _BASE_DIR = os.path.dirname(sys.executable)
+else:
+    _BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Carpeta del propio módulo utils/, usada como ruta fallback
+_FALLBACK_DIR = os.path.dirname(__file__)
+
+@lru_cache(maxsize=4096)
+def resource_path_dir(*parts: str) -> str:
     """
     Resuelve la ruta absoluta de un recurso relativo al proyecto.
+    La ruta relativa puede darse completa o por partes, que se unen en un solo os.path.join:
+      resource_path_dir("assets", "maps", "level.tmx")
 
     - En distribución (frozen) usa la carpeta del ejecutable (dirname(sys.executable)).
     - En desarrollo usa la carpeta `src/` (el padre de `utils/`) como base, de modo que
       resource_path("assets/...") -> <repo>/src/assets/...
     - Si no existe el path construido, intenta una ruta fallback relativa a este módulo.
     - Si ninguno existe lanza FileNotFoundError con información útil.
-    """
-    # 1) Si estamos "frozen" (PyInstaller onefile/onedir) resolvemos respecto al exe
-    if getattr(sys, "frozen", False):
-        base_dir = os.path.dirname(sys.executable)
-    else:
-        # 2) En desarrollo: la raíz de recursos está en src/ (padre de utils/)
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
-    candidate = os.path.join(base_dir, relative_path)
+    Las resoluciones exitosas se cachean (la estructura de carpetas no cambia durante la
+    ejecución); usar resource_path_dir.cache_clear() si se mueven assets en caliente.
+    """
+    candidate = os.path.join(_BASE_DIR, *parts)
     if os.path.exists(candidate):
         return candidate
 
     # Fallback: intentar relativo al propio módulo utils/ (por compatibilidad)
-    fallback = os.path.join(os.path.dirname(__file__), relative_path)
+    fallback = os.path.join(_FALLBACK_DIR, *parts)
     if os.path.exists(fallback):
         return fallback
 
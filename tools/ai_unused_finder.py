@@ -6,18 +6,18 @@ Uso:
 
 Qué hace:
 - importa los registries runtime: ACTIONS (src/ai/actions.py) y CONDITIONS (src/ai/conditions.py)
-- importa todos los módulos en src/data/ y busca dicts `*_BEHAVIOR` o variables `...` con claves 'states'
-- extrae strings usados en entry/update/exit y transitions.cond
+- analiza estáticamente (ast.parse, sin importarlos) todos los módulos en src/data/
+- extrae strings literales usados en entry/update/exit y transitions.cond de cualquier dict
 - reporta acciones/condiciones no referenciadas por ninguna spec
 
 NOTA: no modifica código; solo informa. Requiere ejecutar desde el root del repo.
 """
+import ast
 import sys
 import os
-import importlib
-from typing import Set, Any, Tuple
+from typing import Set, Tuple
 
-# add 'src' to path so modules import as e.g. data.enemies, ai.actions
+# add 'src' to path so the registries import as ai.actions / ai.conditions
 SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
 sys.path.insert(0, os.path.abspath(SRC_DIR))
 
@@ -29,32 +29,38 @@ except Exception as e:
     print("Error importing ai.actions / ai.conditions:", e)
     sys.exit(1)
 
-def collect_strings_from_spec(obj: Any, out_actions: Set[str], out_conds: Set[str]):
+# claves de un estado cuyas listas contienen nombres de acciones
+ENTRY_KEYS = frozenset({"entry", "update", "exit"})
+
+def _str_constants(node: ast.AST):
+    """Devuelve los strings literales de un nodo lista/tupla del AST."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [e.value for e in node.elts if isinstance(e, ast.Constant) and isinstance(e.value, str)]
+    return []
+
+def collect_strings_from_ast(tree: ast.AST, out_actions: Set[str], out_conds: Set[str]):
     """
-    Recorre recursivamente estructuras (dict/list/tuple/str) buscando claves:
+    Recorre todos los dicts literales del AST (ast.walk es iterativo) buscando claves:
       - entry/update/exit -> acciones (strings)
       - transitions -> cond (string) y cond_params (ignored)
     """
-    if isinstance(obj, dict):
-        # if this dict looks like a state def or spec section
-        for k, v in obj.items():
-            if k in ("entry", "update", "exit") and isinstance(v, (list, tuple)):
-                for item in v:
-                    if isinstance(item, str):
-                        out_actions.add(item)
-            if k == "transitions" and isinstance(v, (list, tuple)):
-                for t in v:
-                    if isinstance(t, dict):
-                        c = t.get("cond")
-                        if isinstance(c, str):
-                            out_conds.add(c)
-                        # also consider action-like keys inside transition? (none by default)
-            else:
-                collect_strings_from_spec(v, out_actions, out_conds)
-    elif isinstance(obj, (list, tuple, set)):
-        for it in obj:
-            collect_strings_from_spec(it, out_actions, out_conds)
-    # strings alone not considered top-level unless part of lists/dicts
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Dict):
+            continue
+        for k, v in zip(node.keys, node.values):
+            # k es None para desempaquetados `**otro`
+            if not (isinstance(k, ast.Constant) and isinstance(k.value, str)):
+                continue
+            if k.value in ENTRY_KEYS:
+                out_actions.update(_str_constants(v))
+            elif k.value == "transitions" and isinstance(v, (ast.List, ast.Tuple)):
+                for t in v.elts:
+                    if not isinstance(t, ast.Dict):
+                        continue
+                    for tk, tv in zip(t.keys, t.values):
+                        if (isinstance(tk, ast.Constant) and tk.value == "cond"
+                                and isinstance(tv, ast.Constant) and isinstance(tv.value, str)):
+                            out_conds.add(tv.value)
 
 def scan_data_modules() -> Tuple[Set[str], Set[str], Set[str]]:
     used_actions = set()
@@ -65,26 +71,21 @@ def scan_data_modules() -> Tuple[Set[str], Set[str], Set[str]]:
         print("No src/data directory found.")
         return used_actions, used_conds, scanned_modules
 
-    for fname in os.listdir(data_pkg):
-        if not fname.endswith(".py"):
-            continue
-        mod_name = f"data.{fname[:-3]}"
-        try:
-            mod = importlib.import_module(mod_name)
-            scanned_modules.add(mod_name)
-        except Exception as e:
-            # best-effort: skip modules that raise on import
-            print(f"Warning: could not import {mod_name}: {e}")
-            continue
-        # inspect module globals for dict-like specs (states etc)
-        for nm, val in vars(mod).items():
-            if isinstance(val, dict):
-                # heuristic: dict with key "states" is HSM spec
-                if "states" in val and isinstance(val["states"], dict):
-                    collect_strings_from_spec(val, used_actions, used_conds)
-                else:
-                    # also scan any nested dicts in the module
-                    collect_strings_from_spec(val, used_actions, used_conds)
+    with os.scandir(data_pkg) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".py") or not entry.is_file():
+                continue
+            mod_name = f"data.{name[:-3]}"
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    tree = ast.parse(f.read(), filename=name)
+                scanned_modules.add(mod_name)
+            except (OSError, SyntaxError) as e:
+                # best-effort: skip modules that cannot be read or parsed
+                print(f"Warning: could not parse {mod_name}: {e}")
+                continue
+            collect_strings_from_ast(tree, used_actions, used_conds)
     return used_actions, used_conds, scanned_modules
 
 def main():